@@ -4,8 +4,10 @@ Main application entry point
 """
 
 import logging
+import os
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 from src.config import get_settings
 from src.database import (
@@ -15,8 +17,12 @@ from src.database import (
     create_session,
     update_session,
     create_task,
-    get_credentials
+    store_task_results,
+    get_credentials_bulk,
+    create_indexes,
+    get_background_writer
 )
+from src.auth import get_token_refresher
 from src.core import parse_intent, ExecutionContext, execute_plan
 from src.cli.terminal import (
     console,
@@ -52,21 +58,100 @@ def check_agent_status(user_id: str) -> tuple[bool, bool]:
     Returns:
         tuple: (gmail_connected, github_connected)
     """
-    try:
-        gmail_creds = get_credentials(user_id, "gmail")
-        gmail_connected = gmail_creds is not None
-    except:
-        gmail_connected = False
-    
-    try:
-        github_creds = get_credentials(user_id, "github")
-        github_connected = github_creds is not None
-    except:
-        github_connected = False
+    present = get_credentials_bulk(user_id, ["gmail", "github"])
+    gmail_connected = "gmail" in present
+    github_connected = "github" in present
     
     return gmail_connected, github_connected
 
 
+def _store_turn(
+    session_id: str,
+    user_id: str,
+    user_input: str,
+    execution_plan_data: dict,
+    status: str,
+    result_summaries: dict,
+    results: dict,
+    created_at: datetime
+) -> None:
+    """
+    Persist the task record and result payloads for one user turn.
+    
+    Args:
+        session_id: Session identifier
+        user_id: User identifier
+        user_input: User's input command
+        execution_plan_data: Serializable execution plan
+        status: Overall status (completed or partial)
+        result_summaries: Per-task result summaries
+        results: Full agent results keyed by task ID
+        created_at: Time the turn started
+    """
+    task_record = create_task(
+        session_id=session_id,
+        user_id=user_id,
+        user_input=user_input,
+        execution_plan=execution_plan_data,
+        status=status,
+        results=result_summaries,
+        created_at=created_at
+    )
+    
+    if task_record:
+        store_task_results(
+            task_id=task_record["task_id"],
+            session_id=session_id,
+            results=results,
+            created_at=created_at
+        )
+
+
+def _cmd_exit(user_id: str, conversation_history: list) -> bool:
+    """Say goodbye and stop the main loop."""
+    console.print("\n[yellow]Goodbye! Thanks for using Vienna.[/yellow]\n")
+    return True
+
+
+def _cmd_help(user_id: str, conversation_history: list) -> bool:
+    """Show help with examples."""
+    show_help()
+    return False
+
+
+def _cmd_status(user_id: str, conversation_history: list) -> bool:
+    """Show agent connection status."""
+    gmail_connected, github_connected = check_agent_status(user_id)
+    show_status(gmail_connected, github_connected)
+    return False
+
+
+def _cmd_clear(user_id: str, conversation_history: list) -> bool:
+    """Clear the screen and show the welcome banner again."""
+    clear_screen()
+    show_welcome()
+    return False
+
+
+def _cmd_history(user_id: str, conversation_history: list) -> bool:
+    """Show recent commands."""
+    show_history(conversation_history)
+    return False
+
+
+# Utility commands: handler returns True when the main loop should exit
+_COMMANDS = {
+    "exit": _cmd_exit,
+    "quit": _cmd_exit,
+    "bye": _cmd_exit,
+    "q": _cmd_exit,
+    "help": _cmd_help,
+    "status": _cmd_status,
+    "clear": _cmd_clear,
+    "history": _cmd_history,
+}
+
+
 def main():
     """Main application loop."""
     try:
@@ -74,13 +159,25 @@ def main():
         settings = get_settings()
         logger.info("Vienna starting up...")
         
-        # Initialize database
+        # Worker pool shared by startup and parallel task execution
+        executor = ThreadPoolExecutor(
+            max_workers=min(8, (os.cpu_count() or 2) * 2),
+            thread_name_prefix="vienna"
+        )
+        
+        # Initialize database, warming pool connections in parallel
         db_client = get_db_client()
-        health = db_client.health_check()
+        health_future = executor.submit(db_client.health_check)
+        indexes_future = executor.submit(create_indexes)
+        health = health_future.result()
+        indexes_future.result()
         
         if health['status'] != 'healthy':
-            console.print("[red]✗ Database connection failed.[/red]")
-            console.print("[yellow]Please check your MongoDB connection settings in .env[/yellow]")
+            console.print(
+                "[red]✗ Database connection failed.[/red]\n"
+                "[yellow]Please check your MongoDB connection settings in .env[/yellow]"
+            )
+            executor.shutdown()
             return 1
         
         logger.info("Database connected successfully")
@@ -95,139 +192,130 @@ def main():
         if not user:
             console.print("[dim]Creating user profile...[/dim]")
             create_user(user_id, "user@vienna.local")
-            logger.info(f"Created user: {user_id}")
+            logger.info("Created user: %s", user_id)
         
         # Create session
         session = create_session(user_id)
         session_id = session['session_id']
-        logger.info(f"Session created: {session_id}")
+        logger.info("Session created: %s", session_id)
         
         # Initialize conversation history
         conversation_history = []
         
-        # Main interaction loop
-        while True:
+        # Session and task writes happen off the interactive thread
+        db_writer = get_background_writer()
+        
+        # Whatever ends the loop, stop the refresher and flush queued
+        # session and task writes (the writer runs on a daemon thread)
+        try:
+            # Refresh Gmail tokens before they expire, off the interactive thread
+            token_refresher = get_token_refresher()
+            
             try:
-                # Get user input
-                user_input = get_input()
-                
-                # Handle empty input
-                if not user_input.strip():
-                    continue
-                
-                # Check for utility commands
-                command = user_input.strip().lower()
-                
-                if command in ["exit", "quit", "bye", "q"]:
-                    console.print("\n[yellow]Goodbye! Thanks for using Vienna.[/yellow]\n")
-                    break
-                
-                elif command == "help":
-                    show_help()
-                    continue
-                
-                elif command == "status":
-                    gmail_connected, github_connected = check_agent_status(user_id)
-                    show_status(gmail_connected, github_connected)
-                    continue
-                
-                elif command == "clear":
-                    clear_screen()
-                    show_welcome()
-                    continue
-                
-                elif command == "history":
-                    show_history(conversation_history)
-                    continue
-                
-                # Process natural language command
-                console.print("[dim]Analyzing your request...[/dim]")
-                
-                # Parse intent
-                try:
-                    execution_plan = parse_intent(
-                        user_input,
-                        user_id,
-                        conversation_history
-                    )
-                    
-                    logger.info(
-                        f"Parsed intent: {len(execution_plan.tasks)} tasks, "
-                        f"type: {execution_plan.execution_type}"
-                    )
-                    
-                except Exception as e:
-                    logger.error(f"Intent parsing failed: {e}")
-                    display_error(
-                        str(e),
-                        "Try rephrasing your request or type 'help' for examples."
-                    )
-                    continue
-                
-                # Create execution context
-                context = ExecutionContext(
-                    session_id=session_id,
-                    user_id=user_id,
-                    user_input=user_input
-                )
-                
-                # Execute plan
-                try:
-                    results_summary = execute_plan(execution_plan, context)
-                    
-                    # Display results
-                    console.print("\n[bold green]Results:[/bold green]\n")
-                    
-                    has_results = False
-                    for task in execution_plan.tasks:
-                        result = context.get_result(task.id)
-                        if result:
-                            display_task_result(task, result)
-                            has_results = True
-                    
-                    if not has_results:
-                        console.print("[yellow]No results to display.[/yellow]")
-                    
-                    # Show execution summary if there were failures
-                    if context.has_failures():
-                        failed_count = len(context.get_failed_tasks())
-                        console.print(
-                            f"[yellow]⚠ {failed_count} task(s) failed during execution.[/yellow]"
+                # Main interaction loop
+                while True:
+                    try:
+                        # Get user input
+                        user_input = get_input()
+                        
+                        # Handle empty input
+                        if not user_input.strip():
+                            continue
+                        
+                        # One timestamp shared by everything recorded for this turn
+                        turn_time = datetime.now(timezone.utc)
+                        
+                        # Check for utility commands
+                        command = user_input.strip().lower()
+                        
+                        handler = _COMMANDS.get(command)
+                        if handler is not None:
+                            if handler(user_id, conversation_history):
+                                break
+                            continue
+                        
+                        # Process natural language command
+                        console.print("[dim]Analyzing your request...[/dim]")
+                        
+                        # Parse intent
+                        try:
+                            execution_plan = parse_intent(
+                                user_input,
+                                user_id,
+                                conversation_history
+                            )
+                            
+                            logger.info(
+                                "Parsed intent: %d tasks, type: %s",
+                                len(execution_plan.tasks),
+                                execution_plan.execution_type
+                            )
+                            
+                        except Exception as e:
+                            logger.error("Intent parsing failed: %s", e)
+                            display_error(
+                                str(e),
+                                "Try rephrasing your request or type 'help' for examples."
+                            )
+                            continue
+                        
+                        # Create execution context
+                        context = ExecutionContext(
+                            session_id=session_id,
+                            user_id=user_id,
+                            user_input=user_input,
+                            executor=executor
                         )
-                    
-                except Exception as e:
-                    logger.error(f"Execution failed: {e}")
-                    display_error(
-                        str(e),
-                        "An error occurred while executing your request."
-                    )
-                    continue
-                
-                # Store in conversation history
-                conversation_entry = {
-                    "user_input": user_input,
-                    "system_response": f"Executed {len(execution_plan.tasks)} tasks",
-                    "timestamp": datetime.utcnow()
-                }
-                conversation_history.append(conversation_entry)
-                
-                # Update session in database
-                try:
-                    update_session(
-                        session_id=session_id,
-                        user_input=user_input,
-                        system_response=conversation_entry["system_response"]
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to update session: {e}")
-                
-                # Store task execution in database
-                try:
-                    task_data = {
-                        "session_id": session_id,
-                        "user_id": user_id,
-                        "user_input": user_input,
-                        "execution_plan": {
+                        
+                        # Execute plan
+                        try:
+                            results_summary = execute_plan(execution_plan, context)
+                            
+                            # Display results
+                            console.print("\n[bold green]Results:[/bold green]\n")
+                            
+                            displayed = 0
+                            for task, result in context.iter_task_results(execution_plan.tasks):
+                                display_task_result(task, result)
+                                displayed += 1
+                            
+                            if not displayed:
+                                console.print("[yellow]No results to display.[/yellow]")
+                            
+                            # Show execution summary if there were failures
+                            if context.has_failures():
+                                failed_count = len(context.get_failed_tasks())
+                                console.print(
+                                    f"[yellow]⚠ {failed_count} task(s) failed during execution.[/yellow]"
+                                )
+                            
+                        except Exception as e:
+                            logger.error("Execution failed: %s", e)
+                            display_error(
+                                str(e),
+                                "An error occurred while executing your request."
+                            )
+                            continue
+                        
+                        # Store in conversation history
+                        conversation_entry = {
+                            "user_input": user_input,
+                            "system_response": f"Executed {len(execution_plan.tasks)} tasks",
+                            "timestamp": turn_time
+                        }
+                        conversation_history.append(conversation_entry)
+                        
+                        # Update session in database (written in the background)
+                        db_writer.submit(
+                            update_session,
+                            session_id=session_id,
+                            user_input=user_input,
+                            system_response=conversation_entry["system_response"],
+                            timestamp=turn_time
+                        )
+                        
+                        # Store task execution in database (written in the background)
+                        execution_plan_data = {
                             "tasks": [
                                 {
                                     "id": t.id,
@@ -237,39 +325,47 @@ def main():
                                 } for t in execution_plan.tasks
                             ],
                             "execution_type": execution_plan.execution_type
-                        },
-                        "status": "completed" if not context.has_failures() else "partial",
-                        "results": context.get_all_results()
-                    }
+                        }
+                        result_summaries = {
+                            summary["task_id"]: summary
+                            for summary in context.iter_result_summaries()
+                        }
+                        
+                        db_writer.submit(
+                            _store_turn,
+                            session_id=session_id,
+                            user_id=user_id,
+                            user_input=user_input,
+                            execution_plan_data=execution_plan_data,
+                            status="completed" if not context.has_failures() else "partial",
+                            result_summaries=result_summaries,
+                            results=context.task_results,
+                            created_at=turn_time
+                        )
                     
-                    create_task(
-                        session_id=session_id,
-                        user_id=user_id,
-                        user_input=user_input,
-                        execution_plan=task_data["execution_plan"]
-                    )
+                    except KeyboardInterrupt:
+                        console.print("\n[yellow]Use 'exit' to quit Vienna.[/yellow]")
+                        continue
                     
-                except Exception as e:
-                    logger.warning(f"Failed to store task: {e}")
-            
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Use 'exit' to quit Vienna.[/yellow]")
-                continue
-            
-            except Exception as e:
-                logger.error(f"Unexpected error in main loop: {e}", exc_info=True)
-                display_error(
-                    "An unexpected error occurred.",
-                    "Please try again or type 'exit' to quit."
-                )
-                continue
-        
-        logger.info("Vienna shutting down...")
-        return 0
+                    except Exception as e:
+                        logger.error("Unexpected error in main loop: %s", e, exc_info=True)
+                        display_error(
+                            "An unexpected error occurred.",
+                            "Please try again or type 'exit' to quit."
+                        )
+                        continue
+                
+                logger.info("Vienna shutting down...")
+                return 0
+            finally:
+                token_refresher.close()
+        finally:
+            db_writer.close()
+            executor.shutdown()
         
     except Exception as e:
         console.print(f"\n[red]✗ Fatal error: {e}[/red]")
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         return 1
 
 
@@ -1,11 +1,30 @@
 """Agents module for Vienna AI Agent Orchestration System."""
 
+from typing import TYPE_CHECKING
+
 from .base_agent import BaseAgent
-from .gmail_agent import GmailAgent
-from .github_agent import GitHubAgent
+
+if TYPE_CHECKING:
+    from .gmail_agent import GmailAgent
+    from .github_agent import GitHubAgent
 
 __all__ = [
     "BaseAgent",
     "GmailAgent",
     "GitHubAgent",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import concrete agents on first access; their API clients are slow to import."""
+    if name == "GmailAgent":
+        from .gmail_agent import GmailAgent
+        globals()[name] = GmailAgent
+        return GmailAgent
+    
+    if name == "GitHubAgent":
+        from .github_agent import GitHubAgent
+        globals()[name] = GitHubAgent
+        return GitHubAgent
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,16 +4,31 @@ Provides common functionality and defines the agent interface.
 """
 
 import logging
+import re
+import sys
 import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-from datetime import datetime
 
 from src.config import get_agent_registry
 from src.database import Task
 
 logger = logging.getLogger(__name__)
 
+# Capabilities per agent type, shared across agent instances
+_CAPS_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Network errors, timeouts, and rate limits are typically retryable
+_RETRYABLE_EXCEPTIONS = (ConnectionError, TimeoutError)
+
+# Third-party error classes, matched by name on the exception and its base
+# classes; httpx.TransportError covers connect, read and pool timeouts and
+# dropped connections
+_RETRYABLE_ERROR_NAMES = frozenset({
+    'RateLimitError', 'RateLimitExceededException', 'ServerError', 'TransportError'
+})
+_RETRYABLE_MESSAGE_RE = re.compile(r'timeout|rate limit|temporarily|try again', re.IGNORECASE)
+
 
 class BaseAgent(ABC):
     """
@@ -29,13 +44,20 @@ class BaseAgent(ABC):
         Args:
             user_id: User identifier for authentication and data access
         """
-        self.user_id = user_id
-        self.agent_type = self._get_agent_type()
+        self.user_id = sys.intern(user_id)
+        self.agent_type = sys.intern(self._get_agent_type())
         self.registry = get_agent_registry()
         self.capabilities = self._load_capabilities()
+        self._oauth_required = self.capabilities['oauth_required']
         self._api_call_count = 0
         
-        logger.info(f"Initialized {self.agent_type} agent for user {user_id}")
+        # Metadata fields shared by every result this agent produces
+        self._meta_base = {
+            "agent_type": self.agent_type,
+            "user_id": self.user_id
+        }
+        
+        logger.info("Initialized %s agent for user %s", self.agent_type, user_id)
     
     @abstractmethod
     def _get_agent_type(self) -> str:
@@ -49,7 +71,22 @@ class BaseAgent(ABC):
     
     def _load_capabilities(self) -> Dict[str, Any]:
         """
-        Load agent capabilities from the registry.
+        Load agent capabilities, building them from the registry on first use.
+        
+        Returns:
+            dict: Agent configuration including modes and parameters
+        """
+        capabilities = _CAPS_CACHE.get(self.agent_type)
+        if capabilities is None:
+            capabilities = _CAPS_CACHE.setdefault(self.agent_type, self._build_caps())
+        return capabilities
+    
+    def _build_caps(self) -> Dict[str, Any]:
+        """
+        Build agent capabilities from the registry.
+        
+        Modes and scopes are frozen into tuples since the result is shared
+        between all agents of the same type.
         
         Returns:
             dict: Agent configuration including modes and parameters
@@ -60,12 +97,12 @@ class BaseAgent(ABC):
                 'name': config.get('name'),
                 'type': config.get('type'),
                 'description': config.get('description'),
-                'modes': list(config.get('modes', {}).keys()),
+                'modes': tuple(config.get('modes', {})),
                 'oauth_required': config.get('oauth_required', False),
-                'scopes': config.get('scopes', [])
+                'scopes': tuple(config.get('scopes', []))
             }
         except Exception as e:
-            logger.error(f"Error loading capabilities for {self.agent_type}: {e}")
+            logger.error("Error loading capabilities for %s: %s", self.agent_type, e)
             raise
     
     @abstractmethod
@@ -131,7 +168,7 @@ class BaseAgent(ABC):
         Returns:
             dict: Formatted result with status, data, metadata, and error
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         self._api_call_count = 0
         
         try:
@@ -143,39 +180,39 @@ class BaseAgent(ABC):
                 )
             
             # Authenticate if required
-            if self.capabilities.get('oauth_required'):
-                logger.info(f"Authenticating {self.agent_type} agent...")
+            if self._oauth_required:
+                logger.info("Authenticating %s agent...", self.agent_type)
                 self.authenticate()
             
             # Validate parameters
             self.validate_parameters(task.mode, task.parameters)
             
             # Execute the task
-            logger.info(f"Executing {self.agent_type}.{task.mode} for user {self.user_id}")
+            logger.info("Executing %s.%s for user %s", self.agent_type, task.mode, self.user_id)
             raw_result = self.execute(task.mode, task.parameters, context)
             
             # Format successful output
-            execution_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
             return self.format_output(
                 raw_result,
-                execution_time=execution_time,
+                elapsed_ns=elapsed_ns,
                 api_calls=self._api_call_count
             )
             
         except Exception as e:
             # Handle errors
-            execution_time = time.time() - start_time
-            logger.error(f"Error executing task {task.id}: {e}")
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            logger.error("Error executing task %s: %s", task.id, e)
             return self.handle_error(
                 e,
-                execution_time=execution_time,
+                elapsed_ns=elapsed_ns,
                 api_calls=self._api_call_count
             )
     
     def format_output(
         self,
         raw_data: Dict[str, Any],
-        execution_time: float,
+        elapsed_ns: int,
         api_calls: int
     ) -> Dict[str, Any]:
         """
@@ -183,7 +220,7 @@ class BaseAgent(ABC):
         
         Args:
             raw_data: Raw result data from execution
-            execution_time: Time taken to execute in seconds
+            elapsed_ns: Time taken to execute in nanoseconds
             api_calls: Number of API calls made
             
         Returns:
@@ -193,11 +230,10 @@ class BaseAgent(ABC):
             "status": "success",
             "data": raw_data,
             "metadata": {
-                "execution_time": round(execution_time, 3),
+                "execution_time_ms": elapsed_ns // 1_000_000,
                 "api_calls": api_calls,
-                "timestamp": datetime.utcnow().isoformat(),
-                "agent_type": self.agent_type,
-                "user_id": self.user_id
+                "timestamp_ns": time.time_ns(),
+                **self._meta_base
             },
             "error": None
         }
@@ -205,7 +241,7 @@ class BaseAgent(ABC):
     def handle_error(
         self,
         error: Exception,
-        execution_time: float,
+        elapsed_ns: int,
         api_calls: int
     ) -> Dict[str, Any]:
         """
@@ -213,7 +249,7 @@ class BaseAgent(ABC):
         
         Args:
             error: The exception that occurred
-            execution_time: Time taken before error in seconds
+            elapsed_ns: Time taken before error in nanoseconds
             api_calls: Number of API calls made before error
             
         Returns:
@@ -224,7 +260,10 @@ class BaseAgent(ABC):
         
         # Log the error
         logger.error(
-            f"{self.agent_type} agent error: {error_type}: {error_message}",
+            "%s agent error: %s: %s",
+            self.agent_type,
+            error_type,
+            error_message,
             exc_info=True
         )
         
@@ -235,11 +274,10 @@ class BaseAgent(ABC):
             "status": "error",
             "data": None,
             "metadata": {
-                "execution_time": round(execution_time, 3),
+                "execution_time_ms": elapsed_ns // 1_000_000,
                 "api_calls": api_calls,
-                "timestamp": datetime.utcnow().isoformat(),
-                "agent_type": self.agent_type,
-                "user_id": self.user_id,
+                "timestamp_ns": time.time_ns(),
+                **self._meta_base,
                 "retryable": retryable
             },
             "error": {
@@ -258,30 +296,56 @@ class BaseAgent(ABC):
         Returns:
             bool: True if error is retryable
         """
-        # Network errors, timeouts, and rate limits are typically retryable
-        retryable_types = (
-            'ConnectionError',
-            'TimeoutError',
-            'HTTPError',
-            'RateLimitError',
-            'ServerError'
-        )
-        
-        error_type = type(error).__name__
+        if isinstance(error, _RETRYABLE_EXCEPTIONS):
+            return True
         
-        # Check error type
-        if error_type in retryable_types:
+        # Third-party errors are matched by class name so their libraries
+        # don't need to be imported here
+        if any(cls.__name__ in _RETRYABLE_ERROR_NAMES for cls in type(error).__mro__):
             return True
         
+        # HTTP errors: too many requests and server errors are retryable
+        status_code = self._get_status_code(error)
+        if status_code is not None:
+            return status_code == 429 or 500 <= status_code < 600
+        
         # Check error message for retryable indicators
-        error_message = str(error).lower()
-        retryable_keywords = ['timeout', 'rate limit', 'temporarily', 'try again']
+        return _RETRYABLE_MESSAGE_RE.search(str(error)) is not None
+    
+    @staticmethod
+    def _get_status_code(error: Exception) -> Optional[int]:
+        """
+        Extract the HTTP status code carried by an error, if any.
+        
+        Supports httpx/requests (response.status_code), googleapiclient
+        (resp.status) and PyGithub (status) exceptions.
         
-        return any(keyword in error_message for keyword in retryable_keywords)
+        Args:
+            error: The exception to inspect
+            
+        Returns:
+            int: HTTP status code, or None if the error has none
+        """
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        
+        if status_code is None:
+            response = getattr(error, 'resp', None)
+            status_code = getattr(response, 'status', None)
+        
+        if status_code is None:
+            status_code = getattr(error, 'status', None)
+        
+        return status_code if isinstance(status_code, int) else None
     
-    def _increment_api_calls(self) -> None:
-        """Increment the API call counter."""
-        self._api_call_count += 1
+    def _increment_api_calls(self, n: int = 1) -> None:
+        """
+        Increment the API call counter.
+        
+        Args:
+            n: Number of API calls to record (default: 1)
+        """
+        self._api_call_count += n
     
     def get_supported_modes(self) -> list[str]:
         """
@@ -290,7 +354,7 @@ class BaseAgent(ABC):
         Returns:
             list: List of mode names
         """
-        return self.capabilities.get('modes', [])
+        return list(self.capabilities['modes'])
     
     def get_mode_description(self, mode: str) -> str:
         """
@@ -0,0 +1,219 @@
+"""
+ETag cache for GitHub API responses.
+Keeps recent responses in memory and persists them to SQLite across runs.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from src.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Disk entries older than this, or beyond the newest _MAX_DISK_ENTRIES, are
+# pruned when the cache opens (e.g. rows left behind by rotated tokens)
+_MAX_DISK_AGE_SECONDS = 7 * 24 * 3600
+_MAX_DISK_ENTRIES = 10000
+
+# Total response body bytes kept in memory; larger bodies are served from disk
+_MAX_MEMORY_BYTES = 8 * 1024 * 1024
+
+
+class ETagCache:
+    """
+    Two-level (memory, then disk) cache of (ETag, body) pairs.
+    
+    Entries are keyed by a scope (a digest of the access token) and the
+    full request URL, so users never see each other's responses.
+    """
+    
+    def __init__(self, path: Optional[str], max_memory_bytes: int = _MAX_MEMORY_BYTES):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: SQLite file to persist entries in (None or "" keeps them in memory only)
+            max_memory_bytes: Total size of the response bodies kept in memory
+        """
+        self._memory: Dict[Tuple[str, str], Tuple[str, bytes]] = {}
+        self._memory_bytes = 0
+        self._max_memory_bytes = max_memory_bytes
+        self._lock = threading.Lock()
+        # Guards the connection, so disk I/O doesn't block memory hits
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        
+        if path:
+            self._conn = self._open(path)
+    
+    @staticmethod
+    def _open(path: str) -> Optional[sqlite3.Connection]:
+        """
+        Open (creating if needed) the SQLite cache file and prune stale entries.
+        
+        Args:
+            path: SQLite file path
+        
+        Returns:
+            sqlite3.Connection: Open connection, or None if unavailable
+        """
+        try:
+            # Responses may include private repository data
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o600)
+            os.close(fd)
+            
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS etags ("
+                "scope TEXT NOT NULL, url TEXT NOT NULL, etag TEXT NOT NULL, "
+                "body BLOB NOT NULL, fetched_at REAL NOT NULL, "
+                "PRIMARY KEY (scope, url))"
+            )
+            pruned = conn.execute(
+                "DELETE FROM etags WHERE fetched_at < ?",
+                (time.time() - _MAX_DISK_AGE_SECONDS,)
+            ).rowcount
+            pruned += conn.execute(
+                "DELETE FROM etags WHERE rowid NOT IN "
+                "(SELECT rowid FROM etags ORDER BY fetched_at DESC LIMIT ?)",
+                (_MAX_DISK_ENTRIES,)
+            ).rowcount
+            conn.commit()
+            if pruned:
+                logger.debug("Pruned %d stale GitHub ETag cache entries", pruned)
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("GitHub ETag cache disabled, cannot open %s: %s", path, e)
+            return None
+    
+    def get(self, scope: str, url: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Look up a cached response.
+        
+        Args:
+            scope: Token digest
+            url: Full request URL
+        
+        Returns:
+            tuple: (etag, body), or None if not cached
+        """
+        key = (scope, url)
+        
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None or self._conn is None:
+            return entry
+        
+        try:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT etag, body FROM etags WHERE scope = ? AND url = ?",
+                    key
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("GitHub ETag cache read failed: %s", e)
+            return None
+        
+        if row is None:
+            return None
+        
+        entry = (row[0], bytes(row[1]))
+        with self._lock:
+            self._remember(key, entry)
+        return entry
+    
+    def put(self, scope: str, url: str, etag: str, body: bytes) -> None:
+        """
+        Store a response.
+        
+        Args:
+            scope: Token digest
+            url: Full request URL
+            etag: ETag header value
+            body: Raw response body
+        """
+        key = (scope, url)
+        
+        with self._lock:
+            self._remember(key, (etag, body))
+        
+        if self._conn is None:
+            return
+        
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO etags (scope, url, etag, body, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (scope, url, etag, body, time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("GitHub ETag cache write failed: %s", e)
+    
+    def touch(self, scope: str, url: str) -> None:
+        """
+        Mark a cached response as still current (after a 304).
+        
+        Keeps entries that are revalidated regularly from being pruned
+        by age.
+        
+        Args:
+            scope: Token digest
+            url: Full request URL
+        """
+        if self._conn is None:
+            return
+        
+        try:
+            with self._db_lock:
+                self._conn.execute(
+                    "UPDATE etags SET fetched_at = ? WHERE scope = ? AND url = ?",
+                    (time.time(), scope, url)
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning("GitHub ETag cache write failed: %s", e)
+    
+    def _remember(self, key: Tuple[str, str], entry: Tuple[str, bytes]) -> None:
+        """Insert into the in-memory layer, evicting the oldest entries. Caller holds the lock."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[1])
+        
+        # Bodies too large for the memory budget stay on disk only
+        size = len(entry[1])
+        if size > self._max_memory_bytes:
+            return
+        
+        self._memory[key] = entry
+        self._memory_bytes += size
+        
+        while self._memory_bytes > self._max_memory_bytes:
+            evicted = self._memory.pop(next(iter(self._memory)))
+            self._memory_bytes -= len(evicted[1])
+
+
+# Singleton accessor function
+_etag_cache: Optional[ETagCache] = None
+
+
+def get_etag_cache() -> ETagCache:
+    """
+    Get the singleton ETagCache instance.
+    
+    Returns:
+        ETagCache: The GitHub ETag cache
+    """
+    global _etag_cache
+    if _etag_cache is None:
+        _etag_cache = ETagCache(get_settings().github_cache_file)
+    return _etag_cache
\ No newline at end of file
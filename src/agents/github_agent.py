@@ -3,18 +3,154 @@ GitHub agent for repository operations.
 Provides list_repos and get_repo functionality for GitHub.
 """
 
+import atexit
+import base64
+import functools
+import hashlib
+import importlib.util
 import logging
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
 
-from github import Github, GithubException, RateLimitExceededException
-from github.Repository import Repository
-from github.GithubObject import NotSet
+import httpx
+
+# orjson decodes large payloads several times faster; fall back to stdlib json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from src.agents.base_agent import BaseAgent
+from src.agents.etag_cache import get_etag_cache
 from src.auth import LazyAuthManager
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# HTTP/2 multiplexes the get_repo fan-out over one connection; httpx needs
+# the optional h2 package (pip install "httpx[http2]") to speak it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Upper bound on requests in flight per agent, to stay clear of
+# GitHub's secondary (abuse) rate limits
+_MAX_CONCURRENT_REQUESTS = 10
+
+# Connection limit of the client shared by every agent
+_MAX_CONNECTIONS = 4 * _MAX_CONCURRENT_REQUESTS
+
+# Below this many remaining core requests, fan-outs run one at a time
+_LOW_RATE_LIMIT_THRESHOLD = 50
+
+# README preview length, and the base64 needed to cover it even when
+# every character takes the UTF-8 maximum of 4 bytes
+_README_PREVIEW_CHARS = 1000
+_README_PREFIX_B64_CHARS = -(-_README_PREVIEW_CHARS * 4 // 3) * 4
+
+# Accepted list_repos parameter values
+_VALID_SORT = frozenset({'stars', 'updated', 'created', 'pushed'})
+_VALID_VISIBILITY = frozenset({'all', 'public', 'private'})
+
+# sort_by values the REST repository listings support
+_REST_SORTS = frozenset({'updated', 'created', 'pushed'})
+
+# Map sort_by to GraphQL RepositoryOrderField
+_SORT_FIELDS = {
+    'stars': 'STARGAZERS',
+    'updated': 'UPDATED_AT',
+    'created': 'CREATED_AT',
+    'pushed': 'PUSHED_AT'
+}
+
+# Fetches one page of the viewer's repositories with every listed field
+LIST_REPOSITORIES_QUERY = """
+query($first: Int!, $after: String, $orderBy: RepositoryOrder, $privacy: RepositoryPrivacy) {
+  viewer {
+    repositories(
+      first: $first
+      after: $after
+      orderBy: $orderBy
+      privacy: $privacy
+      ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]
+    ) {
+      nodes {
+        name
+        nameWithOwner
+        description
+        stargazerCount
+        forkCount
+        primaryLanguage { name }
+        url
+        updatedAt
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+# Shared REST client; auth is sent per request, so every task and user
+# reuses one connection pool (one HTTP/2 connection when available)
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+# Workers for the get_repo fan-out, shared by every agent so concurrent
+# tasks reuse threads instead of starting a pool per call
+_fanout_pool: Optional[ThreadPoolExecutor] = None
+_fanout_pool_lock = threading.Lock()
+
+# sha256(token) -> GitHub login, so authenticate doesn't call /user per task
+_usernames: Dict[str, str] = {}
+_usernames_lock = threading.Lock()
+_MAX_CACHED_USERNAMES = 256
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for the GitHub REST and GraphQL APIs.
+    
+    Returns:
+        httpx.Client: Client closed at interpreter exit
+    """
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                base_url=GITHUB_API_URL,
+                http2=_HTTP2_AVAILABLE,
+                headers={
+                    'Accept': 'application/vnd.github+json',
+                    'X-GitHub-Api-Version': '2022-11-28'
+                },
+                timeout=20.0,
+                limits=httpx.Limits(
+                    max_connections=_MAX_CONNECTIONS,
+                    max_keepalive_connections=_MAX_CONCURRENT_REQUESTS
+                )
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+def _get_fanout_pool() -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool for concurrent detail requests.
+    
+    Returns:
+        ThreadPoolExecutor: Pool of _MAX_CONCURRENT_REQUESTS workers
+    """
+    global _fanout_pool
+    with _fanout_pool_lock:
+        if _fanout_pool is None:
+            _fanout_pool = ThreadPoolExecutor(
+                max_workers=_MAX_CONCURRENT_REQUESTS,
+                thread_name_prefix="vienna-github"
+            )
+        return _fanout_pool
+
 
 class GitHubAgent(BaseAgent):
     """
@@ -31,9 +167,13 @@ class GitHubAgent(BaseAgent):
             user_id: User identifier
         """
         super().__init__(user_id)
-        self.github_client = None
+        self.http_client: Optional[httpx.Client] = None
+        self._auth_headers: Dict[str, str] = {}
         self.access_token = None
-        self.authenticated_user = None
+        self.username = None
+        self._cache_scope = None
+        self._last_rate_limit: Optional[Dict[str, Any]] = None
+        self._api_call_lock = threading.Lock()
     
     def _get_agent_type(self) -> str:
         """Return agent type identifier."""
@@ -45,7 +185,7 @@ class GitHubAgent(BaseAgent):
         
         Returns:
             bool: True if authentication successful
-            
+        
         Raises:
             Exception: If authentication fails
         """
@@ -54,16 +194,23 @@ class GitHubAgent(BaseAgent):
             
             # Use lazy authentication - triggers OAuth if needed
             self.access_token = LazyAuthManager.ensure_github_auth(self.user_id)
+            self._cache_scope = hashlib.sha256(self.access_token.encode()).hexdigest()
+            
+            self._auth_headers = {'Authorization': f'Bearer {self.access_token}'}
+            self.http_client = _get_http_client()
             
-            # Create GitHub client
-            self.github_client = Github(self.access_token)
+            # Verify authentication by getting user login, once per token
+            with _usernames_lock:
+                self.username = _usernames.get(self._cache_scope)
             
-            # Get authenticated user
-            self.authenticated_user = self.github_client.get_user()
+            if self.username is None:
+                self.username = self._get_json('/user')['login']
+                with _usernames_lock:
+                    _usernames[self._cache_scope] = self.username
+                    while len(_usernames) > _MAX_CACHED_USERNAMES:
+                        del _usernames[next(iter(_usernames))]
             
-            # Verify authentication by getting user login
-            username = self.authenticated_user.login
-            logger.info(f"GitHub authentication successful for {username}")
+            logger.info(f"GitHub authentication successful for {self.username}")
             
             return True
             
@@ -78,34 +225,34 @@ class GitHubAgent(BaseAgent):
         Args:
             mode: Operation mode (list_repos, get_repo)
             parameters: Parameters to validate
-            
+        
         Returns:
             bool: True if valid
-            
+        
         Raises:
             ValueError: If parameters are invalid
         """
         # Use registry for basic validation
-        valid, error = self.registry.validate_mode_parameters(
+        error = self.registry.validate_mode_parameters(
             self.agent_type,
             mode,
             parameters
         )
         
-        if not valid:
+        if error is not None:
             raise ValueError(error)
         
         # Additional validation for specific modes
         if mode == "list_repos":
             sort_by = parameters.get('sort_by')
-            if sort_by and sort_by not in ['stars', 'updated', 'created', 'pushed']:
+            if sort_by and sort_by not in _VALID_SORT:
                 raise ValueError(
                     f"Invalid sort_by value: {sort_by}. "
                     "Must be one of: stars, updated, created, pushed"
                 )
             
             visibility = parameters.get('visibility')
-            if visibility and visibility not in ['all', 'public', 'private']:
+            if visibility and visibility not in _VALID_VISIBILITY:
                 raise ValueError(
                     f"Invalid visibility value: {visibility}. "
                     "Must be one of: all, public, private"
@@ -121,10 +268,10 @@ class GitHubAgent(BaseAgent):
             mode: Operation mode (list_repos, get_repo)
             parameters: Mode-specific parameters
             context: Execution context
-            
+        
         Returns:
             dict: Result data
-            
+        
         Raises:
             NotImplementedError: If mode is not supported
         """
@@ -135,17 +282,131 @@ class GitHubAgent(BaseAgent):
         else:
             raise NotImplementedError(f"Mode '{mode}' is not implemented for GitHub agent")
     
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request on the shared client with this agent's credentials.
+        
+        Every request that goes over the network passes through here, so
+        it is counted exactly once (including requests made concurrently
+        from the get_repo fan-out) and refreshes the rate limit snapshot.
+        
+        Args:
+            request: Request built on the shared client
+        
+        Returns:
+            httpx.Response: Response, whatever its status
+        """
+        request.headers.update(self._auth_headers)
+        
+        with self._api_call_lock:
+            self._increment_api_calls()
+        
+        response = self.http_client.send(request)
+        self._record_rate_limit(response)
+        return response
+    
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request to the GitHub REST API.
+        
+        Args:
+            method: HTTP method
+            path: API path or absolute URL
+            **kwargs: Extra arguments for httpx
+        
+        Returns:
+            httpx.Response: Successful response
+        
+        Raises:
+            httpx.HTTPStatusError: If GitHub returns an error status
+        """
+        response = self._send(self.http_client.build_request(method, path, **kwargs))
+        response.raise_for_status()
+        return response
+    
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        GET a GitHub API path and decode the JSON body.
+        
+        Responses carrying an ETag are cached (in memory and on disk) and
+        revalidated with If-None-Match, so unchanged resources come back
+        as a 304, which does not count against the rate limit.
+        
+        Args:
+            path: API path
+            params: Query parameters (optional)
+        
+        Returns:
+            Decoded JSON response
+        """
+        request = self.http_client.build_request('GET', path, params=params)
+        url = str(request.url)
+        
+        etag_cache = get_etag_cache()
+        cached = etag_cache.get(self._cache_scope, url)
+        
+        if cached:
+            request.headers['If-None-Match'] = cached[0]
+        
+        response = self._send(request)
+        
+        if response.status_code == 304 and cached:
+            etag_cache.touch(self._cache_scope, url)
+            return _json_loads(cached[1])
+        
+        response.raise_for_status()
+        
+        etag = response.headers.get('ETag')
+        if etag and response.status_code == 200:
+            etag_cache.put(self._cache_scope, url, etag, response.content)
+        
+        # No Content (e.g. contributors of an empty repository)
+        if response.status_code == 204:
+            return None
+        
+        return _json_loads(response.content)
+    
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GitHub GraphQL query.
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+        
+        Returns:
+            dict: The 'data' member of the response
+        
+        Raises:
+            Exception: If GitHub reports GraphQL errors
+        """
+        payload = _json_loads(self._request(
+            'POST',
+            '/graphql',
+            json={'query': query, 'variables': variables}
+        ).content)
+        
+        if payload.get('errors'):
+            messages = '; '.join(e.get('message', str(e)) for e in payload['errors'])
+            raise Exception(f"GitHub GraphQL error: {messages}")
+        
+        return payload['data']
+    
     def _list_repositories(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         List user repositories.
         
+        Public listings use the REST /users/{login}/repos endpoint, whose
+        GETs are revalidated through the ETag cache. Other listings use a
+        single GraphQL query per 100 repositories.
+        
         Args:
             parameters: {
                 'sort_by': Optional sort field (stars, updated, created, pushed),
                 'limit': Max repos to return (default: 10),
                 'visibility': Filter by visibility (all, public, private)
             }
-            
+        
         Returns:
             dict: List of repository objects with metadata
         """
@@ -159,68 +420,107 @@ class GitHubAgent(BaseAgent):
             # Check rate limit before proceeding
             rate_limit_info = self._check_rate_limit()
             
-            # Map sort_by to PyGithub parameter
-            sort_map = {
-                'stars': 'stargazers',
-                'updated': 'updated',
-                'created': 'created',
-                'pushed': 'pushed'
-            }
-            pygithub_sort = sort_map.get(sort_by, 'updated')
-            
-            # Get repositories
-            self._increment_api_calls()
-            repos = self.authenticated_user.get_repos(
-                sort=pygithub_sort,
-                direction='desc',
-                visibility=visibility if visibility != 'all' else NotSet
-            )
-            
-            # Parse repositories
-            repo_list = []
-            repo_names = []
-            repo_urls = []
-            
-            count = 0
-            for repo in repos:
-                if count >= limit:
-                    break
-                
-                self._increment_api_calls()
-                repo_data = self._parse_repository(repo)
-                repo_list.append(repo_data)
-                repo_names.append(repo_data['name'])
-                repo_urls.append(repo_data['url'])
-                
-                count += 1
+            # The REST endpoint cannot sort by stars, GraphQL can
+            if visibility == 'public' and sort_by in _REST_SORTS:
+                repo_list = self._list_public_repositories_rest(sort_by, limit)
+            else:
+                repo_list = self._list_repositories_graphql(sort_by, limit, visibility)
             
             return {
                 'repos': repo_list,
-                'repo_names': repo_names,
-                'repo_urls': repo_urls,
+                'repo_names': [repo['name'] for repo in repo_list],
+                'repo_urls': [repo['url'] for repo in repo_list],
                 'count': len(repo_list),
                 'sort_by': sort_by,
                 'visibility': visibility,
                 'rate_limit': rate_limit_info
             }
             
-        except RateLimitExceededException as e:
-            return self._handle_rate_limit_error(e)
-        except GithubException as e:
+        except httpx.HTTPStatusError as e:
             return self._handle_github_error(e, "list repositories")
         except Exception as e:
             logger.error(f"Error listing repositories: {e}")
             raise
     
+    def _list_repositories_graphql(self, sort_by: str, limit: int, visibility: str) -> list[Dict[str, Any]]:
+        """
+        Fetch the viewer's repositories through GraphQL.
+        
+        Args:
+            sort_by: Sort field (stars, updated, created, pushed)
+            limit: Max repos to return
+            visibility: Visibility filter (all, public, private)
+        
+        Returns:
+            list: Parsed repositories
+        """
+        variables = {
+            'first': min(limit, 100),
+            'after': None,
+            'orderBy': {'field': _SORT_FIELDS.get(sort_by, 'UPDATED_AT'), 'direction': 'DESC'},
+            'privacy': visibility.upper() if visibility != 'all' else None
+        }
+        
+        repo_list = []
+        
+        while len(repo_list) < limit:
+            repositories = self._graphql(LIST_REPOSITORIES_QUERY, variables)['viewer']['repositories']
+            repo_list.extend(self._parse_graphql_repository(node) for node in repositories['nodes'])
+            
+            page_info = repositories['pageInfo']
+            if not page_info['hasNextPage']:
+                break
+            
+            variables['after'] = page_info['endCursor']
+            variables['first'] = min(limit - len(repo_list), 100)
+        
+        return repo_list
+    
+    def _list_public_repositories_rest(self, sort_by: str, limit: int) -> list[Dict[str, Any]]:
+        """
+        Fetch the user's public repositories through REST.
+        
+        Args:
+            sort_by: Sort field (updated, created, pushed)
+            limit: Max repos to return
+        
+        Returns:
+            list: Parsed repositories
+        """
+        params = {
+            'type': 'all',
+            'sort': sort_by,
+            'direction': 'desc',
+            'per_page': min(limit, 100),
+            'page': 1
+        }
+        
+        repo_list = []
+        
+        while len(repo_list) < limit:
+            page = self._get_json(f'/users/{self.username}/repos', params=params)
+            repo_list.extend(self._parse_repository(repo) for repo in page[:limit - len(repo_list)])
+            
+            if len(page) < params['per_page']:
+                break
+            
+            params['page'] += 1
+        
+        return repo_list
+    
     def _get_repository(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Get detailed repository information.
         
+        The languages, contributors and README requests are
+        independent, so they are sent concurrently once the repository
+        itself has been fetched.
+        
         Args:
             parameters: {
                 'repo_name': Repository name (required)
             }
-            
+        
         Returns:
             dict: Detailed repository information
         """
@@ -229,200 +529,353 @@ class GitHubAgent(BaseAgent):
             
             logger.info(f"Getting repository details for: {repo_name}")
             
-            # Check rate limit
-            rate_limit_info = self._check_rate_limit()
+            # Accept both "repo" (owned by the user) and "owner/repo"
+            full_name = repo_name if '/' in repo_name else f"{self.username}/{repo_name}"
             
             # Get repository
-            self._increment_api_calls()
-            repo = self.authenticated_user.get_repo(repo_name)
+            repo = self._get_json(f'/repos/{full_name}')
             
             # Get basic info
             repo_data = self._parse_repository(repo, detailed=True)
             
-            # Get additional details
-            self._increment_api_calls()
-            
-            # Get languages
-            try:
-                self._increment_api_calls()
-                languages = repo.get_languages()
-                repo_data['languages'] = dict(languages)
-            except:
-                repo_data['languages'] = {}
-            
-            # Get top contributors
-            try:
-                self._increment_api_calls()
-                contributors = repo.get_contributors()
-                top_contributors = []
-                for i, contributor in enumerate(contributors):
-                    if i >= 5:  # Top 5 contributors
-                        break
-                    self._increment_api_calls()
-                    top_contributors.append({
-                        'username': contributor.login,
-                        'contributions': contributor.contributions,
-                        'url': contributor.html_url
-                    })
-                repo_data['top_contributors'] = top_contributors
-            except:
-                repo_data['top_contributors'] = []
-            
-            # Get README (optional)
-            try:
-                self._increment_api_calls()
-                readme = repo.get_readme()
-                self._increment_api_calls()
-                repo_data['readme_content'] = readme.decoded_content.decode('utf-8')[:1000]  # First 1000 chars
-                repo_data['readme_url'] = readme.html_url
-            except:
-                repo_data['readme_content'] = None
-                repo_data['readme_url'] = None
-            
-            repo_data['rate_limit'] = rate_limit_info
+            # Fetch the remaining details in parallel, unless the rate
+            # limit is nearly spent
+            if self._fanout_width(3) > 1:
+                pool = _get_fanout_pool()
+                languages_future = pool.submit(self._get_languages, full_name)
+                contributors_future = pool.submit(self._get_top_contributors, full_name)
+                readme_future = pool.submit(self._get_readme, full_name)
+                
+                repo_data['languages'] = languages_future.result()
+                repo_data['top_contributors'] = contributors_future.result()
+                repo_data.update(readme_future.result())
+            else:
+                repo_data['languages'] = self._get_languages(full_name)
+                repo_data['top_contributors'] = self._get_top_contributors(full_name)
+                repo_data.update(self._get_readme(full_name))
+            repo_data['rate_limit'] = self._check_rate_limit()
             
             return repo_data
             
-        except GithubException as e:
-            if e.status == 404:
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
                 raise ValueError(f"Repository '{parameters['repo_name']}' not found")
             return self._handle_github_error(e, "get repository")
-        except RateLimitExceededException as e:
-            return self._handle_rate_limit_error(e)
         except Exception as e:
             logger.error(f"Error getting repository: {e}")
             raise
     
-    def _parse_repository(self, repo: Repository, detailed: bool = False) -> Dict[str, Any]:
+    def _fanout_width(self, requests: int) -> int:
+        """
+        Decide how many independent requests to run concurrently.
+        
+        Args:
+            requests: Number of independent requests to send
+        
+        Returns:
+            int: Worker count, reduced to 1 when the rate limit is nearly spent
+        """
+        rate_info = self._last_rate_limit
+        if rate_info and rate_info['remaining'] < _LOW_RATE_LIMIT_THRESHOLD:
+            return 1
+        
+        return max(1, min(requests, _MAX_CONCURRENT_REQUESTS))
+    
+    def _get_languages(self, full_name: str) -> Dict[str, int]:
+        """
+        Get the language breakdown of a repository.
+        
+        Args:
+            full_name: Repository full name (owner/repo)
+        
+        Returns:
+            dict: Language name -> bytes of code
+        """
+        try:
+            return self._get_json(f'/repos/{full_name}/languages')
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            return {}
+    
+    def _get_top_contributors(self, full_name: str, count: int = 5) -> list[Dict[str, Any]]:
+        """
+        Get the top contributors of a repository.
+        
+        Args:
+            full_name: Repository full name (owner/repo)
+            count: Number of contributors to return
+        
+        Returns:
+            list: Contributor username, contribution count and profile URL
+        """
+        try:
+            contributors = self._get_json(
+                f'/repos/{full_name}/contributors',
+                params={'per_page': count}
+            )
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            return []
+        
+        # Empty repositories answer 204 with no body
+        return [
+            {
+                'username': contributor['login'],
+                'contributions': contributor['contributions'],
+                'url': contributor['html_url']
+            }
+            for contributor in (contributors or [])[:count]
+        ]
+    
+    def _get_readme(self, full_name: str) -> Dict[str, Any]:
+        """
+        Get the beginning of a repository's README.
+        
+        Args:
+            full_name: Repository full name (owner/repo)
+        
+        Returns:
+            dict: 'readme_content' (first 1000 chars) and 'readme_url'
+        """
+        try:
+            readme = self._get_json(f'/repos/{full_name}/readme')
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            return {
+                'readme_content': None,
+                'readme_url': None
+            }
+        
+        # Decode only the base64 prefix that can hold the first 1000 chars.
+        # The API wraps content every 60 chars, so twice the prefix length
+        # always contains enough data once newlines are removed.
+        encoded = readme['content'][:2 * _README_PREFIX_B64_CHARS].replace('\n', '')
+        
+        try:
+            chunk = base64.b64decode(encoded[:_README_PREFIX_B64_CHARS])
+        except ValueError:
+            chunk = b''
+        
+        return {
+            # 'ignore' drops a multi-byte character cut at the chunk boundary
+            'readme_content': chunk.decode('utf-8', 'ignore')[:_README_PREVIEW_CHARS],
+            'readme_url': readme['html_url']
+        }
+    
+    def _parse_graphql_repository(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse a GraphQL repository node into the standard listing format.
+        
+        Args:
+            node: Repository node from LIST_REPOSITORIES_QUERY
+        
+        Returns:
+            dict: Parsed repository data (same keys as _parse_repository)
+        """
+        language = node.get('primaryLanguage')
+        
+        return {
+            'name': node['name'],
+            'full_name': node['nameWithOwner'],
+            'description': node.get('description'),
+            'stars': node.get('stargazerCount', 0),
+            'forks': node.get('forkCount', 0),
+            'language': language['name'] if language else None,
+            'url': node['url'],
+            'updated_at': node.get('updatedAt'),
+        }
+    
+    def _parse_repository(self, repo: Dict[str, Any], detailed: bool = False) -> Dict[str, Any]:
         """
         Parse GitHub repository into standardized format.
         
         Args:
-            repo: GitHub Repository object
+            repo: Repository JSON object from the GitHub API
             detailed: Whether to include detailed information
-            
+        
         Returns:
             dict: Parsed repository data
         """
         basic_data = {
-            'name': repo.name,
-            'full_name': repo.full_name,
-            'description': repo.description,
-            'stars': repo.stargazers_count,
-            'forks': repo.forks_count,
-            'language': repo.language,
-            'url': repo.html_url,
-            'updated_at': repo.updated_at.isoformat() if repo.updated_at else None,
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'description': repo.get('description'),
+            'stars': repo.get('stargazers_count', 0),
+            'forks': repo.get('forks_count', 0),
+            'language': repo.get('language'),
+            'url': repo['html_url'],
+            'updated_at': repo.get('updated_at'),
         }
         
         if detailed:
+            license_info = repo.get('license')
             basic_data.update({
-                'open_issues': repo.open_issues_count,
-                'watchers': repo.watchers_count,
-                'created_at': repo.created_at.isoformat() if repo.created_at else None,
-                'pushed_at': repo.pushed_at.isoformat() if repo.pushed_at else None,
-                'size': repo.size,
-                'default_branch': repo.default_branch,
-                'is_private': repo.private,
-                'is_fork': repo.fork,
-                'is_archived': repo.archived,
-                'license': repo.license.name if repo.license else None,
-                'topics': repo.get_topics() if hasattr(repo, 'get_topics') else [],
+                'open_issues': repo.get('open_issues_count', 0),
+                'watchers': repo.get('watchers_count', 0),
+                'created_at': repo.get('created_at'),
+                'pushed_at': repo.get('pushed_at'),
+                'size': repo.get('size'),
+                'default_branch': repo.get('default_branch'),
+                'is_private': repo.get('private', False),
+                'is_fork': repo.get('fork', False),
+                'is_archived': repo.get('archived', False),
+                'license': license_info['name'] if license_info else None,
+                'topics': repo.get('topics', []),
             })
         
         return basic_data
     
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        """
+        Remember the core rate limit reported in a response's headers.
+        
+        Called for every response, so every REST call refreshes the
+        snapshot at no extra cost.
+        
+        Args:
+            response: Any response from the GitHub API
+        """
+        headers = response.headers
+        
+        # GraphQL responses report the separate GraphQL budget
+        if headers.get('X-RateLimit-Resource', 'core') != 'core':
+            return
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is None:
+            return
+        
+        self._last_rate_limit = {
+            'remaining': int(remaining),
+            'limit': int(headers.get('X-RateLimit-Limit', 5000)),
+            'reset': self._format_reset(headers.get('X-RateLimit-Reset'))
+        }
+    
     def _check_rate_limit(self) -> Dict[str, Any]:
         """
         Check GitHub API rate limit.
         
+        Reads the snapshot taken from the most recent REST response
+        headers, so no request is made.
+        
         Returns:
             dict: Rate limit information
         """
-        try:
-            self._increment_api_calls()
-            rate_limit = self.github_client.get_rate_limit()
-            
-            core_limit = rate_limit.core
-            
-            rate_info = {
-                'remaining': core_limit.remaining,
-                'limit': core_limit.limit,
-                'reset': core_limit.reset.isoformat() if core_limit.reset else None
-            }
-            
-            # Warn if low on requests
-            if core_limit.remaining < 10:
-                logger.warning(
-                    f"GitHub API rate limit low: {core_limit.remaining} requests remaining. "
-                    f"Resets at {core_limit.reset}"
-                )
-            
-            return rate_info
-            
-        except Exception as e:
-            logger.error(f"Error checking rate limit: {e}")
+        rate_info = self._last_rate_limit
+        
+        if rate_info is None:
             return {
                 'remaining': 'unknown',
                 'limit': 5000,
                 'reset': None
             }
+        
+        # Warn if low on requests
+        if rate_info['remaining'] < 10:
+            logger.warning(
+                f"GitHub API rate limit low: {rate_info['remaining']} requests remaining. "
+                f"Resets at {rate_info['reset']}"
+            )
+        
+        return dict(rate_info)
     
-    def _handle_rate_limit_error(self, error: RateLimitExceededException) -> Dict[str, Any]:
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _format_reset(reset: Optional[Any]) -> Optional[str]:
+        """
+        Convert a rate limit reset epoch into an ISO timestamp.
+        
+        Memoized: the reset time only changes once per rate limit window,
+        while this runs on every response.
+        
+        Args:
+            reset: Reset time as epoch seconds (int or numeric string)
+        
+        Returns:
+            str: ISO 8601 UTC timestamp, or None if unknown
+        """
+        if reset is None:
+            return None
+        
+        return datetime.fromtimestamp(int(reset), tz=timezone.utc).isoformat()
+    
+    def _is_rate_limited(self, response: httpx.Response) -> bool:
+        """
+        Check whether an error response was caused by rate limiting.
+        
+        Args:
+            response: Error response from GitHub
+        
+        Returns:
+            bool: True if the rate limit was exceeded
+        """
+        if response.status_code == 429:
+            return True
+        
+        return (
+            response.status_code == 403
+            and response.headers.get('X-RateLimit-Remaining') == '0'
+        )
+    
+    def _handle_rate_limit_error(self, response: httpx.Response) -> Dict[str, Any]:
         """
         Handle GitHub rate limit exceeded error.
         
         Args:
-            error: Rate limit exception
-            
+            response: Rate limited response
+        
         Returns:
             dict: Error details for proper handling
         """
-        try:
-            rate_limit = self.github_client.get_rate_limit()
-            reset_time = rate_limit.core.reset
-            
+        reset_time = self._format_reset(response.headers.get('X-RateLimit-Reset'))
+        
+        if reset_time:
             error_msg = (
                 f"GitHub API rate limit exceeded. "
-                f"Limit resets at {reset_time.strftime('%Y-%m-%d %H:%M:%S UTC')}. "
+                f"Limit resets at {reset_time}. "
                 f"Please wait before retrying."
             )
-        except:
+        else:
             error_msg = "GitHub API rate limit exceeded. Please wait before retrying."
         
         logger.error(error_msg)
         raise Exception(error_msg)
     
-    def _handle_github_error(self, error: GithubException, operation: str) -> Dict[str, Any]:
+    def _handle_github_error(self, error: httpx.HTTPStatusError, operation: str) -> Dict[str, Any]:
         """
         Handle GitHub API errors with specific error messages.
         
         Args:
-            error: GitHub exception
+            error: HTTP status error from the GitHub API
             operation: Operation being performed
-            
+        
         Returns:
             dict: Error details for proper handling
         """
-        status = error.status
+        response = error.response
+        status = response.status_code
+        
+        logger.error(f"GitHub API error during {operation}: {status} - {response.text}")
         
-        logger.error(f"GitHub API error during {operation}: {status} - {error.data}")
+        if self._is_rate_limited(response):
+            return self._handle_rate_limit_error(response)
         
         # Handle specific error codes
         if status == 401:
+            LazyAuthManager.invalidate(self.user_id, "github")
             raise Exception("GitHub authentication failed. Please re-authenticate.")
-        
+            
         elif status == 403:
-            if 'rate limit' in str(error.data).lower():
-                raise Exception("GitHub API rate limit exceeded. Please wait before retrying.")
-            else:
-                raise Exception("Insufficient permissions for this operation.")
-        
+            raise Exception("Insufficient permissions for this operation.")
+            
         elif status == 404:
             raise Exception(f"Resource not found during {operation}.")
-        
+            
         elif status == 422:
-            raise Exception(f"Invalid request: {error.data}")
-        
+            raise Exception(f"Invalid request: {response.text}")
+            
         else:
             raise Exception(f"GitHub API error during {operation}: {str(error)}")
\ No newline at end of file
@@ -5,23 +5,169 @@ Provides read, send, and search functionality for Gmail.
 
 import logging
 import base64
+import functools
+import hashlib
 import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import re
+from datetime import date, datetime, timedelta, timezone
+from email.message import EmailMessage
+import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from google.oauth2.credentials import Credentials
 
+# orjson decodes large payloads several times faster than stdlib json
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
 from src.agents.base_agent import BaseAgent
-from src.auth import LazyAuthManager, get_credential_store
-from src.database import get_credentials
+from src.auth import LazyAuthManager
+from src.config import get_settings, GMAIL_SCOPES
 
 logger = logging.getLogger(__name__)
 
+# Characters allowed by the simple email format check
+# (local@domain.tld, letters-only TLD of 2+ chars)
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+_LOCAL_PART_CHARS = _DOMAIN_CHARS | frozenset('_%+')
+
+# Headers read by _parse_email_message; everything else is left on the server
+_METADATA_HEADERS = ['Subject', 'From', 'To', 'Date']
+
+# Partial response field masks: only the JSON the agent reads is returned
+_LIST_FIELDS = 'messages/id,resultSizeEstimate'
+_METADATA_MESSAGE_FIELDS = 'id,threadId,snippet,labelIds,payload/headers'
+_FULL_MESSAGE_FIELDS = 'id,threadId,snippet,labelIds,payload'
+
+# Subrequests per Gmail batch; Google allows 100 but recommends at most 50
+# to avoid per-user rate limiting
+_BATCH_SIZE = 50
+
+# Parallel requests when messages are fetched individually, kept well
+# under Gmail's per-user concurrent request limit
+_MAX_CONCURRENT_FETCHES = 10
+
+# Subrequest failures worth retrying outside the batch
+_TRANSIENT_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+# Per-thread httplib2.Http objects and Gmail services keyed by user ID.
+# httplib2 keeps TCP/TLS connections alive per Http object but is not
+# thread-safe, so each engine worker thread reuses its own connections
+# and service across GmailAgent instances.
+_thread_http = threading.local()
+
+
+def _get_thread_http(user_id: str) -> httplib2.Http:
+    """
+    Get the calling thread's reusable HTTP transport for a user.
+    
+    Args:
+        user_id: User identifier
+        
+    Returns:
+        httplib2.Http: Transport with persistent connections
+    """
+    pool = getattr(_thread_http, 'pool', None)
+    if pool is None:
+        pool = _thread_http.pool = {}
+    
+    http = pool.get(user_id)
+    if http is None:
+        http = pool[user_id] = httplib2.Http(timeout=30)
+    return http
+
+
+def _get_thread_service(user_id: str, credentials: Credentials):
+    """
+    Get the calling thread's Gmail service for a user, building it if needed.
+    
+    The service is rebuilt only when the access token changes. It uses the
+    discovery document bundled with googleapiclient, so building never
+    fetches it over the network.
+    
+    Args:
+        user_id: User identifier
+        credentials: Current OAuth credentials
+        
+    Returns:
+        Resource: Gmail API service bound to this thread's transport
+    """
+    services = getattr(_thread_http, 'services', None)
+    if services is None:
+        services = _thread_http.services = {}
+    
+    token_digest = hashlib.sha256(credentials.token.encode()).hexdigest()
+    
+    cached = services.get(user_id)
+    if cached is not None and cached[0] == token_digest:
+        return cached[1]
+    
+    service = build(
+        'gmail',
+        'v1',
+        http=AuthorizedHttp(credentials, http=_get_thread_http(user_id)),
+        static_discovery=True,
+        model=_OrjsonModel() if _orjson_loads else None
+    )
+    services[user_id] = (token_digest, service)
+    return service
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson."""
+    
+    def deserialize(self, content):
+        """
+        Decode a JSON response body.
+        
+        Args:
+            content: Response body (bytes or str)
+            
+        Returns:
+            Decoded body; non-JSON content is returned unchanged, as JsonModel does
+        """
+        try:
+            body = _orjson_loads(content)
+        except ValueError:
+            return content
+        
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+@functools.lru_cache(maxsize=8)
+def _date_filter_clause(date_filter: str, today_ordinal: int) -> Optional[str]:
+    """
+    Build the Gmail 'after:' clause for a date filter.
+    
+    Cached per calendar day via today_ordinal, so repeat calls are free.
+    
+    Args:
+        date_filter: Lowercased date filter (today, this_week)
+        today_ordinal: date.today().toordinal()
+        
+    Returns:
+        str: Query clause, or None for unknown filters
+    """
+    if date_filter == 'today':
+        day = date.fromordinal(today_ordinal)
+    elif date_filter == 'this_week':
+        day = date.fromordinal(today_ordinal) - timedelta(days=7)
+    else:
+        return None
+    
+    return f'after:{day.year}/{day.month:02d}/{day.day:02d}'
+
 
 class GmailAgent(BaseAgent):
     """
@@ -41,6 +187,7 @@ class GmailAgent(BaseAgent):
         self.service = None
         self.access_token = None
         self.refresh_token = None
+        self.credentials = None
     
     def _get_agent_type(self) -> str:
         """Return agent type identifier."""
@@ -59,31 +206,26 @@ class GmailAgent(BaseAgent):
         try:
             logger.info(f"Authenticating Gmail for user {self.user_id}")
             
-            # Use lazy authentication - triggers OAuth if needed
-            self.access_token = LazyAuthManager.ensure_gmail_auth(self.user_id)
-            
-            # Get refresh token from database
-            creds_data = get_credentials(self.user_id, "gmail")
-            if creds_data and creds_data.get('encrypted_refresh_token'):
-                credential_store = get_credential_store()
-                self.refresh_token = credential_store.decrypt_token(
-                    creds_data['encrypted_refresh_token']
-                )
+            # Use lazy authentication - triggers OAuth if needed; tokens are
+            # served from LazyAuthManager's cache while still fresh
+            self.access_token, self.refresh_token = LazyAuthManager.ensure_gmail_tokens(
+                self.user_id
+            )
             
             # Build Gmail service
-            from src.config import get_settings
             settings = get_settings()
             
-            credentials = Credentials(
+            self.credentials = Credentials(
                 token=self.access_token,
                 refresh_token=self.refresh_token,
                 token_uri="https://oauth2.googleapis.com/token",
                 client_id=settings.gmail_client_id,
                 client_secret=settings.gmail_client_secret,
-                scopes=settings.get_gmail_scopes()
+                scopes=GMAIL_SCOPES
             )
             
-            self.service = build('gmail', 'v1', credentials=credentials)
+            # Reuse this thread's service and keep-alive connections
+            self.service = _get_thread_service(self.user_id, self.credentials)
             
             logger.info("Gmail authentication successful")
             return True
@@ -107,13 +249,13 @@ class GmailAgent(BaseAgent):
             ValueError: If parameters are invalid
         """
         # Use registry for basic validation
-        valid, error = self.registry.validate_mode_parameters(
+        error = self.registry.validate_mode_parameters(
             self.agent_type,
             mode,
             parameters
         )
         
-        if not valid:
+        if error is not None:
             raise ValueError(error)
         
         # Additional validation for specific modes
@@ -161,7 +303,8 @@ class GmailAgent(BaseAgent):
             parameters: {
                 'query': Optional search query,
                 'max_results': Max emails to fetch (default: 10),
-                'date_filter': Optional date filter (today, this_week)
+                'date_filter': Optional date filter (today, this_week),
+                'include_body': Include the plain-text body (default: False)
             }
             
         Returns:
@@ -171,6 +314,7 @@ class GmailAgent(BaseAgent):
             query = parameters.get('query', '')
             max_results = parameters.get('max_results', 10)
             date_filter = parameters.get('date_filter')
+            include_body = bool(parameters.get('include_body', False))
             
             # Build query string with date filter
             query_string = self._build_query_string(query, date_filter)
@@ -182,7 +326,8 @@ class GmailAgent(BaseAgent):
             results = self.service.users().messages().list(
                 userId='me',
                 q=query_string,
-                maxResults=max_results
+                maxResults=max_results,
+                fields=_LIST_FIELDS
             ).execute()
             
             messages = results.get('messages', [])
@@ -194,23 +339,9 @@ class GmailAgent(BaseAgent):
                     'message': 'No emails found'
                 }
             
-            # Fetch full details for each message
-            emails = []
-            for msg in messages:
-                try:
-                    self._increment_api_calls()
-                    full_msg = self.service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
-                    
-                    email_data = self._parse_email_message(full_msg)
-                    emails.append(email_data)
-                    
-                except HttpError as e:
-                    logger.warning(f"Error fetching message {msg['id']}: {e}")
-                    continue
+            # Fetch details for each message
+            full_messages = self._fetch_messages([msg['id'] for msg in messages], include_body)
+            emails = [self._parse_email_message(full_msg, include_body) for full_msg in full_messages]
             
             return {
                 'emails': emails,
@@ -248,22 +379,20 @@ class GmailAgent(BaseAgent):
             
             logger.info(f"Sending email to {to}")
             
-            # Create message
-            message = MIMEMultipart()
-            message['to'] = to
-            message['subject'] = subject
+            # Create message (single text/plain part, no multipart wrapper)
+            message = EmailMessage()
+            message['To'] = to
+            message['Subject'] = subject
             
             if cc:
-                message['cc'] = cc
+                message['Cc'] = cc
             
-            # Add body
-            msg_body = MIMEText(body, 'plain')
-            message.attach(msg_body)
+            message.set_content(body)
             
             # Encode message
             raw_message = base64.urlsafe_b64encode(
                 message.as_bytes()
-            ).decode('utf-8')
+            ).decode('ascii')
             
             # Send message
             self._increment_api_calls()
@@ -280,7 +409,7 @@ class GmailAgent(BaseAgent):
                 'subject': subject,
                 'cc': cc,
                 'status': 'sent',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': datetime.now(timezone.utc).isoformat()
             }
             
         except HttpError as e:
@@ -296,7 +425,8 @@ class GmailAgent(BaseAgent):
         Args:
             parameters: {
                 'query': Gmail search query (required),
-                'max_results': Max results (optional, default: 10)
+                'max_results': Max results (optional, default: 10),
+                'include_body': Include the plain-text body (optional, default: False)
             }
             
         Returns:
@@ -305,6 +435,7 @@ class GmailAgent(BaseAgent):
         try:
             query = parameters['query']
             max_results = parameters.get('max_results', 10)
+            include_body = bool(parameters.get('include_body', False))
             
             logger.info(f"Searching emails with query: '{query}'")
             
@@ -313,7 +444,8 @@ class GmailAgent(BaseAgent):
             results = self.service.users().messages().list(
                 userId='me',
                 q=query,
-                maxResults=max_results
+                maxResults=max_results,
+                fields=_LIST_FIELDS
             ).execute()
             
             messages = results.get('messages', [])
@@ -326,23 +458,9 @@ class GmailAgent(BaseAgent):
                     'message': 'No emails found matching query'
                 }
             
-            # Fetch full details
-            emails = []
-            for msg in messages:
-                try:
-                    self._increment_api_calls()
-                    full_msg = self.service.users().messages().get(
-                        userId='me',
-                        id=msg['id'],
-                        format='full'
-                    ).execute()
-                    
-                    email_data = self._parse_email_message(full_msg)
-                    emails.append(email_data)
-                    
-                except HttpError as e:
-                    logger.warning(f"Error fetching message {msg['id']}: {e}")
-                    continue
+            # Fetch details
+            full_messages = self._fetch_messages([msg['id'] for msg in messages], include_body)
+            emails = [self._parse_email_message(full_msg, include_body) for full_msg in full_messages]
             
             return {
                 'emails': emails,
@@ -357,6 +475,144 @@ class GmailAgent(BaseAgent):
             logger.error(f"Error searching emails: {e}")
             raise
     
+    def _get_message_request(self, message_id: str, include_body: bool):
+        """
+        Build a messages().get() request.
+        
+        Without the body only the headers the agent displays are requested,
+        so Gmail does not send MIME bodies and attachments. A partial
+        response field mask trims the JSON to what the parser reads.
+        
+        Args:
+            message_id: Gmail message ID
+            include_body: Whether to fetch the full message
+            
+        Returns:
+            HttpRequest: Unexecuted request
+        """
+        if include_body:
+            return self.service.users().messages().get(
+                userId='me',
+                id=message_id,
+                format='full',
+                fields=_FULL_MESSAGE_FIELDS
+            )
+        
+        return self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='metadata',
+            metadataHeaders=_METADATA_HEADERS,
+            fields=_METADATA_MESSAGE_FIELDS
+        )
+    
+    def _fetch_messages(self, message_ids: List[str], include_body: bool = False) -> List[Dict[str, Any]]:
+        """
+        Fetch messages, batched when possible and concurrently otherwise.
+        
+        Messages that cannot be fetched are logged and skipped.
+        
+        Args:
+            message_ids: Gmail message IDs, in display order
+            include_body: Whether to fetch full messages instead of metadata
+            
+        Returns:
+            list: Message objects, in the order of message_ids
+        """
+        fetched: Dict[str, Dict[str, Any]] = {}
+        pending = message_ids
+        
+        if get_settings().gmail_batch_requests:
+            try:
+                pending = self._batch_get_messages(message_ids, fetched, include_body)
+            except Exception as e:
+                logger.warning(f"Gmail batch request failed, fetching concurrently: {e}")
+                pending = [message_id for message_id in message_ids if message_id not in fetched]
+        
+        if pending:
+            fetched.update(self._fetch_messages_concurrent(pending, include_body))
+        
+        return [fetched[message_id] for message_id in message_ids if message_id in fetched]
+    
+    def _batch_get_messages(
+        self,
+        message_ids: List[str],
+        fetched: Dict[str, Dict[str, Any]],
+        include_body: bool
+    ) -> List[str]:
+        """
+        Fetch messages using Gmail HTTP batch requests.
+        
+        Each batch carries up to _BATCH_SIZE messages().get() subrequests in
+        a single round-trip.
+        
+        Args:
+            message_ids: Gmail message IDs
+            fetched: Dict that receives message ID -> message
+            include_body: Whether to fetch full messages instead of metadata
+            
+        Returns:
+            list: IDs whose subrequest hit a transient error (429 or 5xx)
+        """
+        retry: List[str] = []
+        
+        def on_response(request_id: str, response: Dict[str, Any], exception: Optional[HttpError]) -> None:
+            if exception is None:
+                fetched[request_id] = response
+            elif self._get_status_code(exception) in _TRANSIENT_STATUS_CODES:
+                retry.append(request_id)
+            else:
+                logger.warning(f"Error fetching message {request_id}: {exception}")
+        
+        for start in range(0, len(message_ids), _BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            
+            for message_id in message_ids[start:start + _BATCH_SIZE]:
+                batch.add(
+                    self._get_message_request(message_id, include_body),
+                    request_id=message_id
+                )
+            
+            self._increment_api_calls()
+            batch.execute()
+        
+        return retry
+    
+    def _fetch_messages_concurrent(self, message_ids: List[str], include_body: bool) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch messages with concurrent individual requests.
+        
+        Used when batching is disabled or fails. Each worker thread uses its
+        own transport, since httplib2 is not thread-safe.
+        
+        Args:
+            message_ids: Gmail message IDs
+            include_body: Whether to fetch full messages instead of metadata
+            
+        Returns:
+            dict: Message ID -> message, for messages fetched successfully
+        """
+        def fetch(message_id: str) -> Optional[Dict[str, Any]]:
+            http = AuthorizedHttp(self.credentials, http=_get_thread_http(self.user_id))
+            
+            try:
+                return self._get_message_request(message_id, include_body).execute(http=http)
+            except HttpError as e:
+                logger.warning(f"Error fetching message {message_id}: {e}")
+                return None
+        
+        workers = min(_MAX_CONCURRENT_FETCHES, len(message_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fetch, message_ids))
+        
+        self._increment_api_calls(len(message_ids))
+        
+        return {
+            message_id: message
+            for message_id, message in zip(message_ids, results)
+            if message is not None
+        }
+    
     def _build_query_string(self, query: str, date_filter: Optional[str]) -> str:
         """
         Build Gmail query string with date filter.
@@ -374,33 +630,33 @@ class GmailAgent(BaseAgent):
             query_parts.append(query)
         
         if date_filter:
-            if date_filter.lower() == 'today':
-                today = datetime.now().strftime('%Y/%m/%d')
-                query_parts.append(f'after:{today}')
-            
-            elif date_filter.lower() == 'this_week':
-                week_ago = (datetime.now() - timedelta(days=7)).strftime('%Y/%m/%d')
-                query_parts.append(f'after:{week_ago}')
+            clause = _date_filter_clause(date_filter.lower(), date.today().toordinal())
+            if clause:
+                query_parts.append(clause)
         
         return ' '.join(query_parts) if query_parts else ''
     
-    def _parse_email_message(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_email_message(self, message: Dict[str, Any], include_body: bool = False) -> Dict[str, Any]:
         """
         Parse Gmail message into standardized format.
         
         Args:
             message: Raw Gmail message object
+            include_body: Whether message is a full-format message whose body to include
             
         Returns:
             dict: Parsed email data
         """
-        headers = message['payload']['headers']
+        # Index headers by lowercased name once (first occurrence wins)
+        headers = {}
+        for header in message['payload']['headers']:
+            headers.setdefault(header['name'].lower(), header['value'])
         
         # Extract headers
-        subject = self._get_header(headers, 'Subject')
-        from_email = self._get_header(headers, 'From')
-        to_email = self._get_header(headers, 'To')
-        date_str = self._get_header(headers, 'Date')
+        subject = headers.get('subject')
+        from_email = headers.get('from')
+        to_email = headers.get('to')
+        date_str = headers.get('date')
         
         # Get snippet
         snippet = message.get('snippet', '')
@@ -412,7 +668,7 @@ class GmailAgent(BaseAgent):
         except:
             message_date = None
         
-        return {
+        email_data = {
             'id': message['id'],
             'thread_id': message['threadId'],
             'subject': subject,
@@ -422,21 +678,32 @@ class GmailAgent(BaseAgent):
             'snippet': snippet,
             'labels': message.get('labelIds', [])
         }
+        
+        if include_body:
+            email_data['body'] = self._extract_plain_body(message['payload'])
+        
+        return email_data
     
-    def _get_header(self, headers: List[Dict[str, str]], name: str) -> Optional[str]:
+    def _extract_plain_body(self, payload: Dict[str, Any]) -> Optional[str]:
         """
-        Get header value from message headers.
+        Find and decode the first text/plain part of a message payload.
         
         Args:
-            headers: List of header dictionaries
-            name: Header name to find
+            payload: Message payload from a format='full' response
             
         Returns:
-            str: Header value or None
+            str: Plain-text body, or None if the message has none
         """
-        for header in headers:
-            if header['name'].lower() == name.lower():
-                return header['value']
+        if payload.get('mimeType') == 'text/plain':
+            data = payload.get('body', {}).get('data')
+            if data:
+                return base64.urlsafe_b64decode(data).decode('utf-8', 'replace')
+        
+        for part in payload.get('parts', []):
+            body = self._extract_plain_body(part)
+            if body is not None:
+                return body
+        
         return None
     
     def _is_valid_email(self, email: str) -> bool:
@@ -449,12 +716,25 @@ class GmailAgent(BaseAgent):
         Returns:
             bool: True if valid email format
         """
-        if not email:
+        if not email or not email.isascii():
+            return False
+        
+        at = email.find('@')
+        if at < 1:
             return False
         
-        # Simple email regex
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        local, domain = email[:at], email[at + 1:]
+        
+        # The TLD is letters only, so it follows the last dot
+        dot = domain.rfind('.')
+        if dot < 1 or len(domain) - dot < 3:
+            return False
+        
+        return (
+            domain[dot + 1:].isalpha()
+            and _LOCAL_PART_CHARS.issuperset(local)
+            and _DOMAIN_CHARS.issuperset(domain[:dot])
+        )
     
     def _handle_http_error(self, error: HttpError, operation: str) -> Dict[str, Any]:
         """
@@ -474,6 +754,8 @@ class GmailAgent(BaseAgent):
         
         # Handle specific error codes
         if status_code == 401:
+            # Drop cached tokens so the next attempt reloads them
+            LazyAuthManager.invalidate(self.user_id, "gmail")
             raise Exception("Authentication failed. Please re-authenticate.")
         
         elif status_code == 403:
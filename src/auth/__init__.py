@@ -11,6 +11,12 @@ from .oauth_manager import (
     GmailOAuthManager,
     GitHubOAuthManager,
     LazyAuthManager,
+    token_expiry_timestamp,
+)
+
+from .token_refresher import (
+    TokenRefresher,
+    get_token_refresher,
 )
 
 __all__ = [
@@ -23,4 +29,8 @@ __all__ = [
     "GmailOAuthManager",
     "GitHubOAuthManager",
     "LazyAuthManager",
+    "token_expiry_timestamp",
+    # Token Refresher
+    "TokenRefresher",
+    "get_token_refresher",
 ]
\ No newline at end of file
@@ -3,14 +3,29 @@ Credential store for secure token management.
 Provides encryption/decryption for sensitive OAuth tokens.
 """
 
+import base64
 import logging
-from typing import Optional
-from cryptography.fernet import Fernet
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 from src.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Prefix marking tokens encrypted with ChaCha20-Poly1305; anything else is
+# a legacy salted Fernet token
+_AEAD_PREFIX = "v2:"
+_NONCE_SIZE = 12
+
+# Decrypted tokens are reused for this long before being decrypted again
+_DECRYPT_CACHE_TTL_SECONDS = 300.0
+_DECRYPT_CACHE_MAX_ENTRIES = 1024
+
 
 class CredentialStore:
     """Handles encryption and decryption of sensitive credentials."""
@@ -18,18 +33,33 @@ class CredentialStore:
     def __init__(self):
         """Initialize the credential store with encryption key."""
         settings = get_settings()
-        self._cipher = Fernet(settings.encryption_key.encode())
+        self._cipher = settings.fernet
         self._salt = settings.token_salt.encode()
+        
+        # Dedicated AEAD key derived from the Fernet key; the salt is bound
+        # to every token as associated data instead of being encrypted
+        aead_key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"vienna-token-aead"
+        ).derive(base64.urlsafe_b64decode(settings.encryption_key))
+        self._aead = ChaCha20Poly1305(aead_key)
+        
+        # Ciphertext -> (monotonic expiry, plain token). Ciphertexts are
+        # unique per encryption (random nonce/IV), so entries never map across users.
+        self._decrypted: Dict[str, Tuple[float, str]] = {}
+        self._decrypted_lock = threading.Lock()
     
     def encrypt_token(self, token: str) -> str:
         """
-        Encrypt a token using Fernet encryption.
+        Encrypt a token using ChaCha20-Poly1305 with the salt as associated data.
         
         Args:
             token: Plain text token to encrypt
             
         Returns:
-            str: Encrypted token (base64 encoded)
+            str: Encrypted token ("v2:" + base64 of nonce and ciphertext)
             
         Raises:
             ValueError: If token is empty
@@ -38,14 +68,11 @@ class CredentialStore:
             raise ValueError("Token cannot be empty")
         
         try:
-            # Add salt to token for additional security
-            salted_token = self._salt + token.encode()
-            
-            # Encrypt the salted token
-            encrypted = self._cipher.encrypt(salted_token)
+            nonce = os.urandom(_NONCE_SIZE)
+            encrypted = self._aead.encrypt(nonce, token.encode(), self._salt)
             
             # Return as string (base64 encoded)
-            return encrypted.decode()
+            return _AEAD_PREFIX + base64.urlsafe_b64encode(nonce + encrypted).decode()
             
         except Exception as e:
             logger.error(f"Error encrypting token: {e}")
@@ -53,7 +80,10 @@ class CredentialStore:
     
     def decrypt_token(self, encrypted_token: str) -> str:
         """
-        Decrypt a token using Fernet decryption.
+        Decrypt a token (ChaCha20-Poly1305, or legacy salted Fernet).
+        
+        Results are cached in memory for a few minutes, so agents created
+        per task do not repeat the HMAC check and AES decryption.
         
         Args:
             encrypted_token: Encrypted token (base64 encoded string)
@@ -67,12 +97,31 @@ class CredentialStore:
         if not encrypted_token:
             raise ValueError("Encrypted token cannot be empty")
         
+        now = time.monotonic()
+        with self._decrypted_lock:
+            cached = self._decrypted.get(encrypted_token)
+        if cached and cached[0] > now:
+            return cached[1]
+        
         try:
-            # Decrypt the token
-            decrypted = self._cipher.decrypt(encrypted_token.encode())
+            if encrypted_token.startswith(_AEAD_PREFIX):
+                data = base64.urlsafe_b64decode(encrypted_token[len(_AEAD_PREFIX):])
+                token = self._aead.decrypt(
+                    data[:_NONCE_SIZE],
+                    data[_NONCE_SIZE:],
+                    self._salt
+                ).decode()
+            else:
+                # Tokens stored before the AEAD switch: salt prefix + Fernet
+                decrypted = self._cipher.decrypt(encrypted_token.encode())
+                token = decrypted[len(self._salt):].decode()
             
-            # Remove salt and decode
-            token = decrypted[len(self._salt):].decode()
+            with self._decrypted_lock:
+                self._decrypted.pop(encrypted_token, None)
+                self._decrypted[encrypted_token] = (now + _DECRYPT_CACHE_TTL_SECONDS, token)
+                # Evict the oldest entries once the cache is full
+                while len(self._decrypted) > _DECRYPT_CACHE_MAX_ENTRIES:
+                    del self._decrypted[next(iter(self._decrypted))]
             
             return token
             
@@ -80,6 +129,11 @@ class CredentialStore:
             logger.error(f"Error decrypting token: {e}")
             raise ValueError(f"Failed to decrypt token: {e}")
     
+    def clear_cache(self) -> None:
+        """Forget all cached decrypted tokens (e.g. after token rotation)."""
+        with self._decrypted_lock:
+            self._decrypted.clear()
+    
     def encrypt_credentials(
         self,
         access_token: str,
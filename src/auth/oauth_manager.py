@@ -3,32 +3,118 @@ OAuth manager for handling authentication flows.
 Implements OAuth 2.0 flows for Gmail and GitHub services.
 """
 
+import atexit
+import functools
+import hashlib
+import importlib.util
 import logging
+import threading
 import webbrowser
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple, Union
+from datetime import datetime, timezone
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
-import threading
+import time
 
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 import httpx
 
-from src.config import get_settings
+from src.config import get_settings, GMAIL_SCOPES, GITHUB_SCOPES
 from src.database import store_credentials, get_credentials
 from .credential_store import get_credential_store
 
 logger = logging.getLogger(__name__)
 
+# Plain tokens per (user_id, service) -> (access token, monotonic cache
+# expiry, POSIX token expiry or None, monotonic last use, refresh token or
+# None), so repeat ensure_*_auth calls skip the database read and decryption
+_token_cache: Dict[
+    Tuple[str, str],
+    Tuple[str, float, Optional[float], float, Optional[str]]
+] = {}
+_token_cache_lock = threading.Lock()
+
+# Tokens are dropped from the cache, and refreshed, this long before they expire
+_TOKEN_REFRESH_BUFFER_SECONDS = 300.0
+
+# Cache lifetime for tokens without an expiry (GitHub)
+_TOKEN_CACHE_MAX_TTL_SECONDS = 600.0
+
+# Cached tokens unused for this long are dropped instead of refreshed
+_TOKEN_CACHE_IDLE_SECONDS = 1800.0
+
+# sha256(token) -> monotonic time of the last successful GitHub validation,
+# so check_github_auth doesn't call /user for a token it just verified
+_validated_github_tokens: Dict[str, float] = {}
+
+_GITHUB_VALIDATION_TTL_SECONDS = 300.0
+
+
+def _token_digest(token: str) -> str:
+    """Digest used to key per-token state without keeping the plaintext."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_expiry_timestamp(expiry: Union[datetime, float, None]) -> Optional[float]:
+    """
+    Normalize a stored token expiry to a POSIX timestamp.
+    
+    Expiries are stored as floats; older credential rows hold naive UTC
+    datetimes, which are converted here.
+    
+    Args:
+        expiry: Expiry as a POSIX timestamp, naive UTC datetime, or None
+        
+    Returns:
+        float: POSIX timestamp, or None if the token does not expire
+    """
+    if expiry is None or isinstance(expiry, (int, float)):
+        return expiry
+    
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    return expiry.timestamp()
+
+
+@functools.lru_cache(maxsize=1)
+def _github_scope_string() -> str:
+    """Space-separated GitHub scopes for the authorization URL."""
+    return " ".join(GITHUB_SCOPES)
+
+
+# Shared client so token exchange and validation reuse pooled connections
+# instead of paying a TCP + TLS handshake per call
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Get the shared HTTP client for GitHub OAuth calls.
+    
+    Returns:
+        httpx.Client: Pooled client, closed at interpreter exit
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        atexit.register(_http_client.close)
+    return _http_client
+
 
 # OAuth callback handler
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for OAuth callbacks."""
+    """
+    HTTP request handler for OAuth callbacks.
     
-    authorization_code: Optional[str] = None
-    oauth_error: Optional[str] = None
+    Results are stored on the owning _OAuthCallbackServer instance rather
+    than on the class, so they never leak between flows.
+    """
     
     def do_GET(self):
         """Handle GET request from OAuth callback."""
@@ -38,7 +124,7 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
         
         # Check for authorization code
         if 'code' in params:
-            OAuthCallbackHandler.authorization_code = params['code'][0]
+            self.server.authorization_code = params['code'][0]
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
@@ -52,7 +138,7 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
                 </html>
             """)
         elif 'error' in params:
-            OAuthCallbackHandler.oauth_error = params['error'][0]
+            self.server.oauth_error = params['error'][0]
             self.send_response(400)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
@@ -65,12 +151,102 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
                 </body>
                 </html>
             """.encode())
+        else:
+            # Unrelated requests (e.g. /favicon.ico) must not end the wait
+            self.send_response(404)
+            self.end_headers()
+    
+    def log_message(self, format, *args):
+        """Suppress log messages."""
+        pass
+
+
+class _OAuthCallbackServer(HTTPServer):
+    """
+    Local OAuth redirect target, bound once and reused across OAuth flows.
+    """
+    
+    def __init__(self):
+        """Bind the callback server on localhost:8080."""
+        super().__init__(('localhost', 8080), OAuthCallbackHandler)
+        self.authorization_code: Optional[str] = None
+        self.oauth_error: Optional[str] = None
+        
+        # One flow at a time may drive the server
+        self.flow_lock = threading.Lock()
+
+
+# Singleton accessor function
+_callback_server: Optional[_OAuthCallbackServer] = None
+_callback_server_lock = threading.Lock()
+
+
+def _get_callback_server() -> _OAuthCallbackServer:
+    """
+    Get the shared OAuth callback server, binding it on first use.
+    
+    Returns:
+        _OAuthCallbackServer: Callback server, closed at interpreter exit
+    """
+    global _callback_server
+    with _callback_server_lock:
+        if _callback_server is None:
+            _callback_server = _OAuthCallbackServer()
+            atexit.register(_callback_server.server_close)
+        return _callback_server
+
+
+def wait_for_oauth_callback(auth_url: str, timeout: float = 300.0) -> str:
+    """
+    Open the browser at auth_url and wait for the OAuth redirect.
+    
+    The shared callback server is driven from the calling thread, one
+    request at a time, until the callback arrives or the timeout passes.
+    
+    Args:
+        auth_url: Provider authorization URL
+        timeout: Seconds to wait for the user (default: 5 minutes)
+        
+    Returns:
+        str: Authorization code
+        
+    Raises:
+        Exception: If the provider returns an error or the wait times out
+    """
+    server = _get_callback_server()
+    
+    with server.flow_lock:
+        # Reset results from any previous flow
+        server.authorization_code = None
+        server.oauth_error = None
+        
+        # Open browser
+        print(f"📱 Opening browser for authentication...")
+        print(f"If browser doesn't open, visit: {auth_url}\n")
+        webbrowser.open(auth_url)
         
-        # Suppress log messages
-        def log_message(self, format, *args):
-            pass
+        # Wait for callback
+        print("⏳ Waiting for authorization...")
+        deadline = time.monotonic() + timeout
+        
+        while server.authorization_code is None and server.oauth_error is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            server.timeout = remaining
+            server.handle_request()
         
-        OAuthCallbackHandler.log_message = log_message
+        authorization_code = server.authorization_code
+        oauth_error = server.oauth_error
+    
+    if oauth_error:
+        raise Exception(f"OAuth error: {oauth_error}")
+    
+    if not authorization_code:
+        raise Exception("Authorization code not received. OAuth flow timed out.")
+    
+    return authorization_code
 
 
 class GmailOAuthManager:
@@ -103,7 +279,7 @@ class GmailOAuthManager:
                     "redirect_uris": [settings.gmail_redirect_uri]
                 }
             },
-            scopes=settings.get_gmail_scopes()
+            scopes=list(GMAIL_SCOPES)
         )
         
         flow.redirect_uri = settings.gmail_redirect_uri
@@ -115,34 +291,12 @@ class GmailOAuthManager:
             prompt='consent'
         )
         
-        # Reset callback handler
-        OAuthCallbackHandler.authorization_code = None
-        OAuthCallbackHandler.oauth_error = None
-        
-        # Start local server
-        server = HTTPServer(('localhost', 8080), OAuthCallbackHandler)
-        server_thread = threading.Thread(target=server.handle_request)
-        server_thread.daemon = True
-        server_thread.start()
-        
-        # Open browser
-        print(f"📱 Opening browser for authentication...")
-        print(f"If browser doesn't open, visit: {auth_url}\n")
-        webbrowser.open(auth_url)
-        
-        # Wait for callback
-        print("⏳ Waiting for authorization...")
-        server_thread.join(timeout=300)  # 5 minute timeout
-        
-        if OAuthCallbackHandler.oauth_error:
-            raise Exception(f"OAuth error: {OAuthCallbackHandler.oauth_error}")
-        
-        if not OAuthCallbackHandler.authorization_code:
-            raise Exception("Authorization code not received. OAuth flow timed out.")
+        # Open browser and wait for the callback
+        authorization_code = wait_for_oauth_callback(auth_url)
         
         # Exchange code for tokens
         print("✓ Authorization received. Exchanging for tokens...")
-        flow.fetch_token(code=OAuthCallbackHandler.authorization_code)
+        flow.fetch_token(code=authorization_code)
         
         credentials = flow.credentials
         
@@ -152,7 +306,7 @@ class GmailOAuthManager:
         return {
             'access_token': credentials.token,
             'refresh_token': credentials.refresh_token,
-            'token_expiry': credentials.expiry
+            'token_expiry': token_expiry_timestamp(credentials.expiry)
         }
     
     @staticmethod
@@ -191,7 +345,7 @@ class GmailOAuthManager:
             return {
                 'access_token': credentials.token,
                 'refresh_token': credentials.refresh_token or refresh_token,
-                'token_expiry': credentials.expiry
+                'token_expiry': token_expiry_timestamp(credentials.expiry)
             }
             
         except Exception as e:
@@ -220,14 +374,12 @@ class GmailOAuthManager:
                     'credentials': None
                 }
             
-            # Check if token is expired
-            token_expiry = creds.get('token_expiry')
-            needs_refresh = False
-            
-            if token_expiry:
-                # Add 5 minute buffer
-                if datetime.utcnow() + timedelta(minutes=5) >= token_expiry:
-                    needs_refresh = True
+            # Check if token is expired (with a 5 minute buffer)
+            token_expiry = token_expiry_timestamp(creds.get('token_expiry'))
+            needs_refresh = (
+                token_expiry is not None
+                and time.time() + _TOKEN_REFRESH_BUFFER_SECONDS >= token_expiry
+            )
             
             return {
                 'authenticated': True,
@@ -264,52 +416,27 @@ class GitHubOAuthManager:
         print("\n🔐 GitHub authentication required. Opening browser...")
         
         # Build authorization URL
-        scopes = settings.get_github_scopes()
-        scope_string = " ".join(scopes)
-        
         auth_url = (
             f"https://github.com/login/oauth/authorize"
             f"?client_id={settings.github_client_id}"
             f"&redirect_uri={settings.github_redirect_uri}"
-            f"&scope={scope_string}"
+            f"&scope={_github_scope_string()}"
         )
         
-        # Reset callback handler
-        OAuthCallbackHandler.authorization_code = None
-        OAuthCallbackHandler.oauth_error = None
-        
-        # Start local server
-        server = HTTPServer(('localhost', 8080), OAuthCallbackHandler)
-        server_thread = threading.Thread(target=server.handle_request)
-        server_thread.daemon = True
-        server_thread.start()
-        
-        # Open browser
-        print(f"📱 Opening browser for authentication...")
-        print(f"If browser doesn't open, visit: {auth_url}\n")
-        webbrowser.open(auth_url)
-        
-        # Wait for callback
-        print("⏳ Waiting for authorization...")
-        server_thread.join(timeout=300)  # 5 minute timeout
-        
-        if OAuthCallbackHandler.oauth_error:
-            raise Exception(f"OAuth error: {OAuthCallbackHandler.oauth_error}")
-        
-        if not OAuthCallbackHandler.authorization_code:
-            raise Exception("Authorization code not received. OAuth flow timed out.")
+        # Open browser and wait for the callback
+        authorization_code = wait_for_oauth_callback(auth_url)
         
         # Exchange code for access token
         print("✓ Authorization received. Exchanging for token...")
         
         token_url = "https://github.com/login/oauth/access_token"
         
-        response = httpx.post(
+        response = _get_http_client().post(
             token_url,
             data={
                 'client_id': settings.github_client_id,
                 'client_secret': settings.github_client_secret,
-                'code': OAuthCallbackHandler.authorization_code,
+                'code': authorization_code,
                 'redirect_uri': settings.github_redirect_uri
             },
             headers={'Accept': 'application/json'}
@@ -340,7 +467,7 @@ class GitHubOAuthManager:
             dict: User info if valid, None otherwise
         """
         try:
-            response = httpx.get(
+            response = _get_http_client().get(
                 'https://api.github.com/user',
                 headers={
                     'Authorization': f'Bearer {token}',
@@ -349,6 +476,8 @@ class GitHubOAuthManager:
             )
             
             if response.status_code == 200:
+                with _token_cache_lock:
+                    _validated_github_tokens[_token_digest(token)] = time.monotonic()
                 return response.json()
             else:
                 logger.warning(f"GitHub token validation failed: {response.status_code}")
@@ -384,6 +513,20 @@ class GitHubOAuthManager:
             credential_store = get_credential_store()
             access_token = credential_store.decrypt_token(creds['encrypted_token'])
             
+            # Skip the /user round trip for a recently validated token
+            with _token_cache_lock:
+                validated_at = _validated_github_tokens.get(_token_digest(access_token))
+            
+            if validated_at is not None and (
+                time.monotonic() - validated_at < _GITHUB_VALIDATION_TTL_SECONDS
+            ):
+                return {
+                    'authenticated': True,
+                    'valid': True,
+                    'credentials': creds,
+                    'user_info': None
+                }
+            
             user_info = GitHubOAuthManager.validate_github_token(access_token)
             
             return {
@@ -405,6 +548,174 @@ class GitHubOAuthManager:
 class LazyAuthManager:
     """Manages lazy authentication - only authenticate when needed."""
     
+    @staticmethod
+    def _get_cached_tokens(user_id: str, service: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return cached (access token, refresh token) while still fresh, or None."""
+        now = time.monotonic()
+        with _token_cache_lock:
+            cached = _token_cache.get((user_id, service))
+            if not cached or cached[1] <= now:
+                return None
+            
+            # Record the use so the background refresher keeps this token fresh
+            token, cache_expiry, token_expiry, _, refresh_token = cached
+            _token_cache[(user_id, service)] = (
+                token, cache_expiry, token_expiry, now, refresh_token
+            )
+        
+        return token, refresh_token
+    
+    @staticmethod
+    def _cache_token(
+        user_id: str,
+        service: str,
+        token: str,
+        expiry: Union[datetime, float, None],
+        refresh_token: Optional[str] = None,
+        touch: bool = True
+    ) -> None:
+        """
+        Cache an access token until shortly before it expires.
+        
+        Tokens with an expiry are cached until 5 minutes before it; tokens
+        without one (GitHub) for at most 10 minutes.
+        
+        Args:
+            user_id: User identifier
+            service: Service name (gmail, github)
+            token: Plain access token
+            expiry: Token expiry (POSIX timestamp or naive UTC datetime),
+                or None if it does not expire
+            refresh_token: Plain refresh token, if the service has one
+            touch: Count this as a use of the token (False keeps the
+                previous entry's last use, for background refreshes)
+        """
+        expiry = token_expiry_timestamp(expiry)
+        if expiry is None:
+            ttl = _TOKEN_CACHE_MAX_TTL_SECONDS
+        else:
+            ttl = expiry - _TOKEN_REFRESH_BUFFER_SECONDS - time.time()
+        
+        if ttl > 0:
+            now = time.monotonic()
+            with _token_cache_lock:
+                last_used = now
+                previous = _token_cache.get((user_id, service))
+                if not touch and previous is not None:
+                    last_used = previous[3]
+                _token_cache[(user_id, service)] = (
+                    token, now + ttl, expiry, last_used, refresh_token
+                )
+    
+    @staticmethod
+    def invalidate(user_id: str, service: Optional[str] = None) -> None:
+        """
+        Drop cached access tokens, e.g. after a token is rejected.
+        
+        Args:
+            user_id: User identifier
+            service: Service name (gmail, github), or None for all services
+        """
+        with _token_cache_lock:
+            for key in [k for k in _token_cache if k[0] == user_id and service in (None, k[1])]:
+                token = _token_cache.pop(key)[0]
+                if key[1] == "github":
+                    _validated_github_tokens.pop(_token_digest(token), None)
+    
+    @staticmethod
+    def _refresh_gmail_token(
+        user_id: str,
+        creds: Dict[str, Any],
+        touch: bool = True
+    ) -> Tuple[str, str]:
+        """
+        Refresh a user's Gmail token, then store and cache the new tokens.
+        
+        Args:
+            user_id: User identifier
+            creds: Stored Gmail credentials document
+            touch: Count this as a use of the token (see _cache_token)
+            
+        Returns:
+            tuple: (new access token, refresh token)
+        """
+        credential_store = get_credential_store()
+        
+        # Decrypt refresh token
+        refresh_token = credential_store.decrypt_token(
+            creds['encrypted_refresh_token']
+        )
+        
+        # Refresh tokens
+        new_tokens = GmailOAuthManager.refresh_gmail_token(refresh_token)
+        
+        # Encrypt and store new tokens
+        encrypted_access, encrypted_refresh = credential_store.encrypt_credentials(
+            new_tokens['access_token'],
+            new_tokens['refresh_token']
+        )
+        
+        store_credentials(
+            user_id=user_id,
+            service="gmail",
+            encrypted_token=encrypted_access,
+            encrypted_refresh_token=encrypted_refresh,
+            token_expiry=new_tokens['token_expiry']
+        )
+        
+        LazyAuthManager._cache_token(
+            user_id,
+            "gmail",
+            new_tokens['access_token'],
+            new_tokens['token_expiry'],
+            refresh_token=new_tokens['refresh_token'],
+            touch=touch
+        )
+        return new_tokens['access_token'], new_tokens['refresh_token']
+    
+    @staticmethod
+    def refresh_expiring_tokens(window_seconds: float) -> int:
+        """
+        Refresh cached Gmail tokens that expire within window_seconds.
+        
+        Cache entries end 5 minutes before the token expires, so a window
+        wider than that refreshes recently used tokens ahead of the inline
+        fallback. Entries unused for 30 minutes are dropped instead, so idle
+        users are not refreshed for as long as the process runs.
+        
+        Args:
+            window_seconds: How far ahead of token expiry to refresh
+            
+        Returns:
+            int: Number of tokens refreshed
+        """
+        horizon = time.time() + window_seconds
+        idle_cutoff = time.monotonic() - _TOKEN_CACHE_IDLE_SECONDS
+        user_ids = []
+        
+        with _token_cache_lock:
+            for key, (_, _, token_expiry, last_used, _) in list(_token_cache.items()):
+                if last_used < idle_cutoff:
+                    del _token_cache[key]
+                elif key[1] == "gmail" and token_expiry is not None and token_expiry <= horizon:
+                    user_ids.append(key[0])
+        
+        refreshed = 0
+        for user_id in user_ids:
+            try:
+                creds = get_credentials(user_id, "gmail")
+                if not creds or not creds.get('encrypted_refresh_token'):
+                    continue
+                
+                LazyAuthManager._refresh_gmail_token(user_id, creds, touch=False)
+                refreshed += 1
+                logger.info(f"Refreshed Gmail token for user {user_id} in background")
+            except Exception as e:
+                # The inline refresh in ensure_gmail_auth remains as fallback
+                logger.warning(f"Background Gmail token refresh failed for {user_id}: {e}")
+        
+        return refreshed
+    
     @staticmethod
     def ensure_gmail_auth(user_id: str) -> str:
         """
@@ -419,6 +730,29 @@ class LazyAuthManager:
         Raises:
             Exception: If authentication fails
         """
+        return LazyAuthManager.ensure_gmail_tokens(user_id)[0]
+    
+    @staticmethod
+    def ensure_gmail_tokens(user_id: str) -> Tuple[str, Optional[str]]:
+        """
+        Ensure Gmail authentication and return the access and refresh tokens.
+        
+        Both come from the token cache while the access token is fresh, so
+        repeat calls skip the database read and decryption.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            tuple: (valid access token, refresh token or None)
+            
+        Raises:
+            Exception: If authentication fails
+        """
+        cached = LazyAuthManager._get_cached_tokens(user_id, "gmail")
+        if cached:
+            return cached
+        
         credential_store = get_credential_store()
         
         # Check current auth status
@@ -427,40 +761,32 @@ class LazyAuthManager:
         if auth_status['authenticated']:
             creds = auth_status['credentials']
             
-            # Check if refresh needed
+            # Check if refresh needed (fallback; TokenRefresher usually
+            # refreshes cached tokens before they get here)
             if auth_status['needs_refresh']:
                 logger.info("Gmail token expired, refreshing...")
                 print("🔄 Refreshing Gmail token...")
                 
-                # Decrypt refresh token
-                refresh_token = credential_store.decrypt_token(
-                    creds['encrypted_refresh_token']
-                )
-                
-                # Refresh tokens
-                new_tokens = GmailOAuthManager.refresh_gmail_token(refresh_token)
-                
-                # Encrypt and store new tokens
-                encrypted_access, encrypted_refresh = credential_store.encrypt_credentials(
-                    new_tokens['access_token'],
-                    new_tokens['refresh_token']
-                )
-                
-                store_credentials(
-                    user_id=user_id,
-                    service="gmail",
-                    encrypted_token=encrypted_access,
-                    encrypted_refresh_token=encrypted_refresh,
-                    token_expiry=new_tokens['token_expiry']
-                )
+                tokens = LazyAuthManager._refresh_gmail_token(user_id, creds)
                 
                 print("✓ Gmail token refreshed\n")
-                return new_tokens['access_token']
+                return tokens
             
             else:
-                # Decrypt and return existing token
+                # Decrypt and return existing tokens
                 access_token = credential_store.decrypt_token(creds['encrypted_token'])
-                return access_token
+                refresh_token = None
+                if creds.get('encrypted_refresh_token'):
+                    refresh_token = credential_store.decrypt_token(creds['encrypted_refresh_token'])
+                
+                LazyAuthManager._cache_token(
+                    user_id,
+                    "gmail",
+                    access_token,
+                    creds.get('token_expiry'),
+                    refresh_token=refresh_token
+                )
+                return access_token, refresh_token
         
         else:
             # Need to authenticate
@@ -483,7 +809,14 @@ class LazyAuthManager:
                 token_expiry=tokens['token_expiry']
             )
             
-            return tokens['access_token']
+            LazyAuthManager._cache_token(
+                user_id,
+                "gmail",
+                tokens['access_token'],
+                tokens['token_expiry'],
+                refresh_token=tokens['refresh_token']
+            )
+            return tokens['access_token'], tokens['refresh_token']
     
     @staticmethod
     def ensure_github_auth(user_id: str) -> str:
@@ -499,6 +832,10 @@ class LazyAuthManager:
         Raises:
             Exception: If authentication fails
         """
+        cached = LazyAuthManager._get_cached_tokens(user_id, "github")
+        if cached:
+            return cached[0]
+        
         credential_store = get_credential_store()
         
         # Check current auth status
@@ -508,6 +845,7 @@ class LazyAuthManager:
             # Decrypt and return existing token
             creds = auth_status['credentials']
             access_token = credential_store.decrypt_token(creds['encrypted_token'])
+            LazyAuthManager._cache_token(user_id, "github", access_token, None)
             return access_token
         
         else:
@@ -528,4 +866,5 @@ class LazyAuthManager:
                 token_expiry=None  # GitHub tokens don't expire
             )
             
+            LazyAuthManager._cache_token(user_id, "github", tokens['access_token'], None)
             return tokens['access_token']
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Background token refresher for Vienna AI Agent Orchestration System.
+Refreshes cached Gmail tokens on a daemon thread before they expire, so
+agent calls don't block on a token refresh round trip.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from .oauth_manager import LazyAuthManager
+
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefresher:
+    """
+    Periodically refreshes Gmail tokens that are about to expire.
+    """
+    
+    def __init__(self, interval: float = 60.0, window: float = 600.0):
+        """
+        Initialize the refresher and start its worker thread.
+        
+        Args:
+            interval: Seconds between scans of the token cache
+            window: Refresh tokens that expire within this many seconds
+        """
+        self._interval = interval
+        self._window = window
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="vienna-token-refresher",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """
+        Stop the worker thread.
+        
+        Args:
+            timeout: Seconds to wait for an in-flight refresh to finish
+        """
+        if not self._thread.is_alive():
+            return
+        
+        self._stop.set()
+        self._thread.join(timeout)
+    
+    def _run(self) -> None:
+        """Scan the token cache every interval until stopped."""
+        while not self._stop.wait(self._interval):
+            try:
+                LazyAuthManager.refresh_expiring_tokens(self._window)
+            except Exception as e:
+                logger.error("Background token refresh failed: %s", e, exc_info=True)
+
+
+# Singleton accessor function
+_token_refresher: Optional[TokenRefresher] = None
+
+
+def get_token_refresher() -> TokenRefresher:
+    """
+    Get the singleton TokenRefresher instance.
+    
+    Returns:
+        TokenRefresher: The token refresher instance
+    """
+    global _token_refresher
+    if _token_refresher is None:
+        _token_refresher = TokenRefresher()
+    return _token_refresher
\ No newline at end of file
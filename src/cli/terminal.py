@@ -10,12 +10,39 @@ from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.prompt import Prompt
-from rich.markdown import Markdown
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Preformatted markup
+_STATUS_CONNECTED = "[green]✓ Connected[/green]"
+_STATUS_NOT_CONNECTED = "[red]✗ Not connected[/red]"
+_ERROR_PREFIX = "\n[red]✗ Error:[/red] "
+
+# Result table limits; long cells keep *_KEEP characters plus the ellipsis
+_ELLIPSIS = "..."
+_EMAIL_DISPLAY_LIMIT = 20
+_SUBJECT_MAX = 60
+_SUBJECT_KEEP = _SUBJECT_MAX - len(_ELLIPSIS)
+_DESCRIPTION_MAX = 50
+_DESCRIPTION_KEEP = _DESCRIPTION_MAX - len(_ELLIPSIS)
+
+# Large repo lists are rendered this many rows at a time, so rich lays out
+# and holds one page of rows instead of the whole table
+_TABLE_PAGE_ROWS = 200
+
+# Repository detail rows: (key, label, shown when zero/empty)
+_REPO_DETAIL_ROWS = (
+    ("full_name", "Full Name", False),
+    ("description", "Description", False),
+    ("stars", "⭐ Stars", True),
+    ("forks", "🍴 Forks", True),
+    ("language", "Language", False),
+    ("open_issues", "Open Issues", False),
+    ("created_at", "Created", False),
+    ("updated_at", "Updated", False),
+)
+
 
 def show_welcome() -> None:
     """Display welcome message."""
@@ -71,6 +98,9 @@ def show_help() -> None:
 • `exit` - Exit Vienna
 """
     
+    # rich.markdown pulls in markdown-it; only load it when help is shown
+    from rich.markdown import Markdown
+    
     console.print(Markdown(help_text))
 
 
@@ -86,11 +116,8 @@ def show_status(gmail_connected: bool, github_connected: bool) -> None:
     table.add_column("Agent", style="cyan")
     table.add_column("Status", style="white")
     
-    gmail_status = "[green]✓ Connected[/green]" if gmail_connected else "[red]✗ Not connected[/red]"
-    github_status = "[green]✓ Connected[/green]" if github_connected else "[red]✗ Not connected[/red]"
-    
-    table.add_row("Gmail", gmail_status)
-    table.add_row("GitHub", github_status)
+    table.add_row("Gmail", _STATUS_CONNECTED if gmail_connected else _STATUS_NOT_CONNECTED)
+    table.add_row("GitHub", _STATUS_CONNECTED if github_connected else _STATUS_NOT_CONNECTED)
     
     console.print("\n")
     console.print(table)
@@ -147,22 +174,21 @@ def display_email_results(emails: List[Dict[str, Any]]) -> None:
     table.add_column("From", style="green", width=30)
     table.add_column("Subject", style="yellow")
     
-    for email in emails[:20]:  # Limit to 20 for display
-        date = email.get("date", "")
-        sender = email.get("from", "")
-        subject = email.get("subject", "(no subject)")
+    # Parsed emails always carry these keys; missing headers are None
+    for email in emails[:_EMAIL_DISPLAY_LIMIT]:
+        subject = email["subject"] or "(no subject)"
         
         # Truncate long subjects
-        if len(subject) > 60:
-            subject = subject[:57] + "..."
+        if len(subject) > _SUBJECT_MAX:
+            subject = f"{subject[:_SUBJECT_KEEP]}{_ELLIPSIS}"
         
-        table.add_row(date, sender, subject)
+        table.add_row(email["date"], email["from"], subject)
     
     console.print("\n")
     console.print(table)
     
-    if len(emails) > 20:
-        console.print(f"[dim]... and {len(emails) - 20} more emails[/dim]")
+    if len(emails) > _EMAIL_DISPLAY_LIMIT:
+        console.print(f"[dim]... and {len(emails) - _EMAIL_DISPLAY_LIMIT} more emails[/dim]")
     
     console.print("\n")
 
@@ -178,27 +204,34 @@ def display_repo_results(repos: List[Dict[str, Any]]) -> None:
         console.print("[yellow]No repositories found.[/yellow]")
         return
     
-    table = Table(title=f"Repositories ({len(repos)} found)", border_style="cyan")
-    table.add_column("Name", style="cyan", width=25)
-    table.add_column("⭐ Stars", style="yellow", justify="right", width=10)
-    table.add_column("Language", style="green", width=15)
-    table.add_column("Description")
-    
-    for repo in repos:
-        name = repo.get("name", "")
-        stars = str(repo.get("stars", 0))
-        language = repo.get("language") or "N/A"
-        description = repo.get("description") or ""
+    console.print("\n")
+    
+    for start in range(0, len(repos), _TABLE_PAGE_ROWS):
+        # Only the first page carries the title and header; fixed column
+        # widths keep later pages aligned with it
+        first_page = start == 0
+        table = Table(
+            title=f"Repositories ({len(repos)} found)" if first_page else None,
+            show_header=first_page,
+            border_style="cyan"
+        )
+        table.add_column("Name", style="cyan", width=25)
+        table.add_column("⭐ Stars", style="yellow", justify="right", width=10)
+        table.add_column("Language", style="green", width=15)
+        table.add_column("Description", width=_DESCRIPTION_MAX)
         
-        # Truncate long descriptions
-        if len(description) > 50:
-            description = description[:47] + "..."
+        for repo in repos[start:start + _TABLE_PAGE_ROWS]:
+            description = repo["description"] or ""
+            
+            # Truncate long descriptions
+            if len(description) > _DESCRIPTION_MAX:
+                description = f"{description[:_DESCRIPTION_KEEP]}{_ELLIPSIS}"
+            
+            table.add_row(repo["name"], str(repo["stars"]), repo["language"] or "N/A", description)
         
-        table.add_row(name, stars, language, description)
+        console.print(table)
     
     console.print("\n")
-    console.print(table)
-    console.print("\n")
 
 
 def display_repo_details(repo: Dict[str, Any]) -> None:
@@ -216,26 +249,12 @@ def display_repo_details(repo: Dict[str, Any]) -> None:
     table.add_column("Value", style="white")
     
     # Add fields
-    if repo.get('full_name'):
-        table.add_row("Full Name", repo['full_name'])
-    
-    if repo.get('description'):
-        table.add_row("Description", repo['description'])
-    
-    table.add_row("⭐ Stars", str(repo.get('stars', 0)))
-    table.add_row("🍴 Forks", str(repo.get('forks', 0)))
-    
-    if repo.get('language'):
-        table.add_row("Language", repo['language'])
-    
-    if repo.get('open_issues'):
-        table.add_row("Open Issues", str(repo['open_issues']))
-    
-    if repo.get('created_at'):
-        table.add_row("Created", repo['created_at'])
-    
-    if repo.get('updated_at'):
-        table.add_row("Updated", repo['updated_at'])
+    for key, label, always in _REPO_DETAIL_ROWS:
+        value = repo.get(key)
+        if value:
+            table.add_row(label, str(value))
+        elif always:
+            table.add_row(label, "0")
     
     console.print(table)
     
@@ -288,7 +307,7 @@ def display_error(error_message: str, helpful_hint: Optional[str] = None) -> Non
         error_message: Error message to display
         helpful_hint: Optional helpful hint for user
     """
-    console.print(f"\n[red]✗ Error:[/red] {error_message}")
+    console.print(f"{_ERROR_PREFIX}{error_message}")
     
     if helpful_hint:
         console.print(f"[dim]{helpful_hint}[/dim]")
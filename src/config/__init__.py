@@ -1,6 +1,12 @@
 """Configuration module for Vienna AI Agent Orchestration System."""
 
-from .settings import Settings, get_settings, generate_encryption_key
+from .settings import (
+    Settings,
+    get_settings,
+    generate_encryption_key,
+    GMAIL_SCOPES,
+    GITHUB_SCOPES,
+)
 from .agent_registry import (
     AgentRegistry,
     get_agent_registry,
@@ -15,6 +21,8 @@ __all__ = [
     "Settings",
     "get_settings",
     "generate_encryption_key",
+    "GMAIL_SCOPES",
+    "GITHUB_SCOPES",
     # Agent Registry
     "AgentRegistry",
     "get_agent_registry",
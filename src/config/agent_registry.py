@@ -3,34 +3,110 @@ Agent registry loader for Vienna AI Agent Orchestration System.
 Loads and provides access to agent configurations from agent_registry.yaml.
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Optional
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Tuple
 import yaml
 
 from .settings import get_settings
 
+# libyaml's C loader parses the same documents with the same safety
+# guarantees, several times faster than the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# "name (required)", "name (optional)", "name (optional: a, b)" or
+# "name (optional, default: value)"
+_PARAM_SPEC_RE = re.compile(
+    r'^\s*(?P<name>[^\s(]+)\s*\((?P<kind>required|optional)\b'
+    r'(?:[^)]*?\bdefault:(?P<default>[^)]*))?[^)]*\)',
+    re.IGNORECASE
+)
+
+# How often a registry lookup may check the file for changes
+_RELOAD_CHECK_INTERVAL_SECONDS = 5.0
+
+
+class _RegistryTables(NamedTuple):
+    """Every table built from one load of the registry, published together."""
+    
+    registry: Dict[str, Any]
+    
+    # (agent_type, mode) -> mode config and parsed parameter specs
+    mode_configs: Dict[Tuple[str, str], Dict[str, Any]]
+    required: Dict[Tuple[str, str], Tuple[str, ...]]
+    optional: Dict[Tuple[str, str], Dict[str, Any]]
+    
+    # Read-only views shared by all callers
+    configs: Dict[str, Mapping[str, Any]]
+    modes_by_agent: Dict[str, Tuple[str, ...]]
+    oauth_scopes: Dict[str, Tuple[str, ...]]
+    agent_summaries: Tuple[Mapping[str, Any], ...]
+
 
 class AgentRegistry:
     """Loads and manages agent configurations from YAML registry."""
     
     def __init__(self):
         """Initialize the agent registry."""
-        self._registry: Optional[Dict[str, Any]] = None
+        # Replaced by a single assignment on each (re)load, so a lookup
+        # never mixes tables from two versions of the file
+        self._tables: Optional[_RegistryTables] = None
+        
+        # (st_mtime_ns, st_size) last seen by a change check, so a file that
+        # fails to load is not reloaded on every check
+        self._seen_signature: Optional[Tuple[int, int]] = None
+        self._next_reload_check = 0.0
+        self._reload_lock = threading.Lock()
+        
         self._load_registry()
     
     def _load_registry(self) -> None:
-        """Load the agent registry from YAML file."""
+        """Load the agent registry from YAML file (or its parsed cache)."""
         settings = get_settings()
         registry_path = settings.agent_registry_path
         
         try:
-            with open(registry_path, 'r') as f:
-                data = yaml.safe_load(f)
-                self._registry = data.get('agents', {})
+            stat = os.stat(registry_path)
+            with open(registry_path, 'rb') as f:
+                raw = f.read()
             
-            logger.info(f"Loaded agent registry with {len(self._registry)} agents")
+            cache_path = registry_path.with_name(f"{registry_path.name}.cache.json")
+            digest = hashlib.sha256(raw).hexdigest()
+            
+            data = self._read_cache(cache_path, digest)
+            from_cache = data is not None
+            if not from_cache:
+                data = yaml.load(raw, Loader=_SafeLoader)
+            
+            agents = self._normalize_agents(data.get('agents', {}))
+            
+            # Build every table, then publish them all at once
+            self._tables = _RegistryTables(
+                agents,
+                *self._index_parameters(agents),
+                *self._build_views(agents)
+            )
+            
+            # Only a registry that loaded successfully is cached
+            if not from_cache:
+                self._write_cache(cache_path, digest, data)
+            self._seen_signature = (stat.st_mtime_ns, stat.st_size)
+            self._next_reload_check = time.monotonic() + _RELOAD_CHECK_INTERVAL_SECONDS
+            
+            logger.info(f"Loaded agent registry with {len(agents)} agents")
             
         except FileNotFoundError:
             logger.error(f"Agent registry file not found: {registry_path}")
@@ -42,7 +118,233 @@ class AgentRegistry:
             logger.error(f"Error loading agent registry: {e}")
             raise
     
-    def get_agent_config(self, agent_type: str) -> Dict[str, Any]:
+    @staticmethod
+    def _normalize_agents(agents: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill in optional fields and intern agent type and mode names.
+        
+        Every agent and mode config gets all of its optional keys, so the
+        rest of the registry can index them directly. Agent and mode names
+        key every registry table, so they are interned.
+        
+        Args:
+            agents: Parsed 'agents' mapping
+            
+        Returns:
+            dict: The normalized mapping
+        """
+        normalized = {}
+        for agent_type, config in agents.items():
+            config.setdefault('name', None)
+            config.setdefault('description', None)
+            config.setdefault('oauth_required', False)
+            config.setdefault('scopes', [])
+            
+            modes = {}
+            for mode, mode_config in (config.get('modes') or {}).items():
+                mode_config.setdefault('description', 'No description available')
+                mode_config.setdefault('parameters', [])
+                modes[sys.intern(mode)] = mode_config
+            config['modes'] = modes
+            
+            normalized[sys.intern(agent_type)] = config
+        return normalized
+    
+    def _index_parameters(self, agents: Dict[str, Any]) -> Tuple[Dict, Dict, Dict]:
+        """
+        Index mode configs and parse their parameter specs into required/optional tables.
+        
+        Args:
+            agents: Parsed 'agents' mapping
+            
+        Returns:
+            tuple: (mode configs, required names, optional defaults), keyed by (agent_type, mode)
+        """
+        mode_configs = {}
+        required_params = {}
+        optional_params = {}
+        
+        for agent_type, config in agents.items():
+            for mode, mode_config in config['modes'].items():
+                mode_configs[(agent_type, mode)] = mode_config
+                
+                required = []
+                optional = {}
+                
+                for param in mode_config['parameters']:
+                    param_name, is_required, default = self._parse_parameter_spec(
+                        agent_type, mode, param
+                    )
+                    if is_required:
+                        required.append(param_name)
+                    elif is_required is not None:
+                        optional[param_name] = default
+                
+                required_params[(agent_type, mode)] = tuple(required)
+                optional_params[(agent_type, mode)] = optional
+        
+        return mode_configs, required_params, optional_params
+    
+    @staticmethod
+    def _build_views(agents: Dict[str, Any]) -> Tuple[Dict, Dict, Dict, Tuple]:
+        """
+        Precompute the read-only results returned by the registry getters.
+        
+        Args:
+            agents: Parsed 'agents' mapping
+            
+        Returns:
+            tuple: (configs, modes by agent, OAuth scopes, agent summaries)
+        """
+        configs = {
+            agent_type: MappingProxyType(config)
+            for agent_type, config in agents.items()
+        }
+        modes_by_agent = {
+            agent_type: tuple(config['modes'])
+            for agent_type, config in agents.items()
+        }
+        oauth_scopes = {
+            agent_type: tuple(config['scopes'])
+            for agent_type, config in agents.items()
+        }
+        agent_summaries = tuple(
+            MappingProxyType({
+                'type': agent_type,
+                'name': config['name'],
+                'description': config['description'],
+                'modes': modes_by_agent[agent_type],
+                'oauth_required': config['oauth_required']
+            })
+            for agent_type, config in agents.items()
+        )
+        return configs, modes_by_agent, oauth_scopes, agent_summaries
+    
+    def _check_for_changes(self) -> None:
+        """
+        Reload the registry if the YAML file changed.
+        
+        At most one check runs per interval; it is a single stat, so it runs
+        inline. Lookups on other threads keep serving the current tables
+        during a reload, and a failed reload is logged and leaves the current
+        registry in place.
+        """
+        now = time.monotonic()
+        if now < self._next_reload_check or not self._reload_lock.acquire(blocking=False):
+            return
+        
+        try:
+            self._next_reload_check = now + _RELOAD_CHECK_INTERVAL_SECONDS
+            
+            stat = os.stat(get_settings().agent_registry_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature != self._seen_signature:
+                self._seen_signature = signature
+                logger.info("Agent registry changed on disk, reloading")
+                self._load_registry()
+        except Exception as e:
+            logger.warning(f"Agent registry reload failed, keeping current registry: {e}")
+        finally:
+            self._reload_lock.release()
+    
+    @staticmethod
+    def _parse_parameter_spec(agent_type: str, mode: str, param: Any) -> Tuple[str, Optional[bool], Any]:
+        """
+        Parse a parameter spec string.
+        
+        Args:
+            agent_type: Agent type the spec belongs to (for error messages)
+            mode: Mode the spec belongs to (for error messages)
+            param: "name (required)" or "name (optional, default: value)"
+            
+        Returns:
+            tuple: (name, True/False for required/optional or None if neither, default)
+            
+        Raises:
+            ValueError: If the spec is not a string
+        """
+        if not isinstance(param, str):
+            # An unquoted "name (optional, default: x)" parses as a mapping
+            raise ValueError(
+                f"Invalid parameter spec {param!r} for {agent_type}.{mode}: "
+                "expected a string; quote specs that contain ': '"
+            )
+        
+        match = _PARAM_SPEC_RE.match(param)
+        if match is None:
+            return param.split('(')[0].strip(), None, None
+        
+        param_name = match['name']
+        if match['kind'].lower() == 'required':
+            return param_name, True, None
+        
+        # Extract default value if present
+        default = None
+        if match['default'] is not None:
+            default_str = match['default'].strip()
+            if default_str.lower() in ('true', 'false'):
+                # "false" as a string would be truthy
+                default = default_str.lower() == 'true'
+            else:
+                try:
+                    # Try to parse as int
+                    default = int(default_str)
+                except ValueError:
+                    # Keep as string
+                    default = default_str
+        
+        return param_name, False, default
+    
+    @staticmethod
+    def _read_cache(cache_path: Path, digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the parsed registry cached from a previous run.
+        
+        The sidecar is plain JSON, so a tampered file can at worst fail
+        to load; it is used only if it was parsed from identical YAML.
+        
+        Args:
+            cache_path: JSON sidecar path
+            digest: SHA-256 of the current YAML file
+            
+        Returns:
+            dict: Parsed registry, or None if the cache is missing, stale or unreadable
+        """
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = json.loads(f.read())
+            if cached['sha256'] != digest or not isinstance(cached['data'], dict):
+                return None
+            return cached['data']
+        except Exception:
+            return None
+    
+    @staticmethod
+    def _write_cache(cache_path: Path, digest: str, data: Dict[str, Any]) -> None:
+        """
+        Atomically write the parsed registry next to the YAML file.
+        
+        Args:
+            cache_path: JSON sidecar path
+            digest: SHA-256 of the YAML file the data was parsed from
+            data: Parsed registry
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            payload = json.dumps({'sha256': digest, 'data': data}, separators=(',', ':'))
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            # Read-only installs (or values JSON can't hold) just parse the
+            # YAML every time
+            logger.debug(f"Could not write agent registry cache: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+    
+    def get_agent_config(self, agent_type: str) -> Mapping[str, Any]:
         """
         Get complete configuration for an agent.
         
@@ -50,39 +352,47 @@ class AgentRegistry:
             agent_type: Agent type identifier (gmail, github)
             
         Returns:
-            dict: Complete agent configuration
+            Mapping: Complete agent configuration (read-only view)
             
         Raises:
             ValueError: If agent type not found
         """
-        if self._registry is None:
+        self._check_for_changes()
+        
+        tables = self._tables
+        if tables is None:
             raise RuntimeError("Agent registry not loaded")
         
-        if agent_type not in self._registry:
-            available = list(self._registry.keys())
+        config = tables.configs.get(agent_type)
+        if config is None:
+            available = list(tables.registry.keys())
             raise ValueError(
                 f"Agent type '{agent_type}' not found. "
                 f"Available agents: {available}"
             )
         
-        return self._registry[agent_type]
+        return config
     
-    def get_agent_modes(self, agent_type: str) -> List[str]:
+    def get_agent_modes(self, agent_type: str) -> Tuple[str, ...]:
         """
-        Get list of available modes for an agent.
+        Get available modes for an agent.
         
         Args:
             agent_type: Agent type identifier (gmail, github)
             
         Returns:
-            list: List of mode names
+            tuple: Mode names
             
         Raises:
             ValueError: If agent type not found
         """
-        config = self.get_agent_config(agent_type)
-        modes = config.get('modes', {})
-        return list(modes.keys())
+        modes = self._tables.modes_by_agent.get(agent_type)
+        if modes is None:
+            # Raises the descriptive unknown agent error (or reloads a
+            # registry that gained the agent)
+            self.get_agent_config(agent_type)
+            modes = self._tables.modes_by_agent[agent_type]
+        return modes
     
     def get_mode_parameters(self, agent_type: str, mode: str) -> Dict[str, Any]:
         """
@@ -98,8 +408,14 @@ class AgentRegistry:
         Raises:
             ValueError: If agent type or mode not found
         """
+        self._check_for_changes()
+        
+        mode_config = self._tables.mode_configs.get((agent_type, mode))
+        if mode_config is not None:
+            return mode_config
+        
         config = self.get_agent_config(agent_type)
-        modes = config.get('modes', {})
+        modes = config['modes']
         
         if mode not in modes:
             available = list(modes.keys())
@@ -122,7 +438,7 @@ class AgentRegistry:
             str: Mode description
         """
         mode_config = self.get_mode_parameters(agent_type, mode)
-        return mode_config.get('description', 'No description available')
+        return mode_config['description']
     
     def get_required_parameters(self, agent_type: str, mode: str) -> List[str]:
         """
@@ -135,18 +451,14 @@ class AgentRegistry:
         Returns:
             list: List of required parameter names
         """
-        mode_config = self.get_mode_parameters(agent_type, mode)
-        parameters = mode_config.get('parameters', [])
-        
-        # Parse parameter strings to extract required ones
-        required = []
-        for param in parameters:
-            # Format: "name (required)" or "name (optional, default: value)"
-            param_name = param.split('(')[0].strip()
-            if '(required)' in param.lower():
-                required.append(param_name)
+        required = self._tables.required.get((agent_type, mode))
+        if required is None:
+            # Raises the descriptive unknown agent/mode error (or reloads
+            # a registry that gained the mode)
+            self.get_mode_parameters(agent_type, mode)
+            required = self._tables.required.get((agent_type, mode), ())
         
-        return required
+        return list(required)
     
     def get_optional_parameters(self, agent_type: str, mode: str) -> Dict[str, Any]:
         """
@@ -159,50 +471,27 @@ class AgentRegistry:
         Returns:
             dict: Parameter name -> default value mapping
         """
-        mode_config = self.get_mode_parameters(agent_type, mode)
-        parameters = mode_config.get('parameters', [])
+        optional = self._tables.optional.get((agent_type, mode))
+        if optional is None:
+            # Raises the descriptive unknown agent/mode error (or reloads
+            # a registry that gained the mode)
+            self.get_mode_parameters(agent_type, mode)
+            optional = self._tables.optional.get((agent_type, mode), {})
         
-        optional = {}
-        for param in parameters:
-            if '(optional' in param.lower():
-                param_name = param.split('(')[0].strip()
-                
-                # Extract default value if present
-                if 'default:' in param.lower():
-                    default_str = param.split('default:')[1].split(')')[0].strip()
-                    try:
-                        # Try to parse as int
-                        default = int(default_str)
-                    except ValueError:
-                        # Keep as string
-                        default = default_str
-                    optional[param_name] = default
-                else:
-                    optional[param_name] = None
-        
-        return optional
+        return dict(optional)
     
-    def list_all_agents(self) -> List[Dict[str, Any]]:
+    def list_all_agents(self) -> Tuple[Mapping[str, Any], ...]:
         """
-        Get list of all available agents with their basic info.
+        Get all available agents with their basic info.
         
         Returns:
-            list: List of agent info dictionaries
+            tuple: Read-only agent info mappings
         """
-        if self._registry is None:
+        tables = self._tables
+        if tables is None:
             raise RuntimeError("Agent registry not loaded")
         
-        agents = []
-        for agent_type, config in self._registry.items():
-            agents.append({
-                'type': agent_type,
-                'name': config.get('name'),
-                'description': config.get('description'),
-                'modes': list(config.get('modes', {}).keys()),
-                'oauth_required': config.get('oauth_required', False)
-            })
-        
-        return agents
+        return tables.agent_summaries
     
     def requires_oauth(self, agent_type: str) -> bool:
         """
@@ -215,9 +504,9 @@ class AgentRegistry:
             bool: True if OAuth is required
         """
         config = self.get_agent_config(agent_type)
-        return config.get('oauth_required', False)
+        return config['oauth_required']
     
-    def get_oauth_scopes(self, agent_type: str) -> List[str]:
+    def get_oauth_scopes(self, agent_type: str) -> Tuple[str, ...]:
         """
         Get OAuth scopes required for an agent.
         
@@ -225,17 +514,22 @@ class AgentRegistry:
             agent_type: Agent type identifier
             
         Returns:
-            list: List of OAuth scope strings
+            tuple: OAuth scope strings
         """
-        config = self.get_agent_config(agent_type)
-        return config.get('scopes', [])
+        scopes = self._tables.oauth_scopes.get(agent_type)
+        if scopes is None:
+            # Raises the descriptive unknown agent error (or reloads a
+            # registry that gained the agent)
+            self.get_agent_config(agent_type)
+            scopes = self._tables.oauth_scopes[agent_type]
+        return scopes
     
     def validate_mode_parameters(
         self,
         agent_type: str,
         mode: str,
         parameters: Dict[str, Any]
-    ) -> tuple[bool, Optional[str]]:
+    ) -> Optional[str]:
         """
         Validate that all required parameters are present.
         
@@ -245,25 +539,30 @@ class AgentRegistry:
             parameters: Parameters dictionary to validate
             
         Returns:
-            tuple: (is_valid, error_message)
+            str: Error message, or None if the parameters are valid
         """
+        self._check_for_changes()
+        
         try:
-            required = self.get_required_parameters(agent_type, mode)
+            required = self._tables.required.get((agent_type, mode))
+            if required is None:
+                required = self.get_required_parameters(agent_type, mode)
             
             # Check for missing required parameters
             missing = [p for p in required if p not in parameters]
             
             if missing:
-                return False, f"Missing required parameters: {', '.join(missing)}"
+                return f"Missing required parameters: {', '.join(missing)}"
             
-            return True, None
+            return None
             
         except Exception as e:
-            return False, str(e)
+            return str(e)
 
 
 # Singleton instance
 _agent_registry: Optional[AgentRegistry] = None
+_agent_registry_lock = threading.Lock()
 
 
 def get_agent_registry() -> AgentRegistry:
@@ -275,17 +574,20 @@ def get_agent_registry() -> AgentRegistry:
     """
     global _agent_registry
     if _agent_registry is None:
-        _agent_registry = AgentRegistry()
+        # Agents are created on worker threads; build the instance only once
+        with _agent_registry_lock:
+            if _agent_registry is None:
+                _agent_registry = AgentRegistry()
     return _agent_registry
 
 
 # Convenience functions
-def get_agent_config(agent_type: str) -> Dict[str, Any]:
+def get_agent_config(agent_type: str) -> Mapping[str, Any]:
     """Get agent configuration."""
     return get_agent_registry().get_agent_config(agent_type)
 
 
-def get_agent_modes(agent_type: str) -> List[str]:
+def get_agent_modes(agent_type: str) -> Tuple[str, ...]:
     """Get agent modes."""
     return get_agent_registry().get_agent_modes(agent_type)
 
@@ -295,6 +597,6 @@ def get_mode_parameters(agent_type: str, mode: str) -> Dict[str, Any]:
     return get_agent_registry().get_mode_parameters(agent_type, mode)
 
 
-def list_all_agents() -> List[Dict[str, Any]]:
+def list_all_agents() -> Tuple[Mapping[str, Any], ...]:
     """List all agents."""
     return get_agent_registry().list_all_agents()
\ No newline at end of file
@@ -3,6 +3,9 @@ Configuration settings for Vienna AI Agent Orchestration System.
 Loads environment variables and provides validated settings throughout the application.
 """
 
+import os
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 from pydantic import Field, field_validator
@@ -10,6 +13,20 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from cryptography.fernet import Fernet
 
 
+# OAuth scopes are fixed at build time; kept as tuples so they can be shared
+GMAIL_SCOPES = (
+    "https://www.googleapis.com/auth/gmail.readonly",
+    "https://www.googleapis.com/auth/gmail.send"
+)
+GITHUB_SCOPES = ("repo", "read:user")
+
+
+def _default_github_cache_file() -> str:
+    """Per-user GitHub cache path, independent of the working directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "vienna", "github_cache.sqlite3")
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -17,12 +34,15 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        frozen=True
     )
     
     # MongoDB Atlas Configuration
     mongodb_uri: str = Field(..., description="MongoDB Atlas connection string")
     database_name: str = Field(default="vienna", description="MongoDB database name")
+    db_min_pool_size: int = Field(default=10, description="Connections opened eagerly at startup")
+    db_max_pool_size: int = Field(default=50, description="Maximum connections in the pool")
     
     # Anthropic API Configuration
     anthropic_api_key: str = Field(..., description="Anthropic Claude API key")
@@ -35,6 +55,11 @@ class Settings(BaseSettings):
         description="Gmail OAuth redirect URI"
     )
     
+    gmail_batch_requests: bool = Field(
+        default=True,
+        description="Fetch Gmail messages with HTTP batch requests (concurrent requests otherwise)"
+    )
+    
     # GitHub OAuth Configuration
     github_client_id: str = Field(..., description="GitHub OAuth client ID")
     github_client_secret: str = Field(..., description="GitHub OAuth client secret")
@@ -43,6 +68,11 @@ class Settings(BaseSettings):
         description="GitHub OAuth redirect URI"
     )
     
+    github_cache_file: str = Field(
+        default_factory=_default_github_cache_file,
+        description="SQLite file for cached GitHub responses (empty disables persistence)"
+    )
+    
     # Security Configuration
     encryption_key: str = Field(..., description="Fernet encryption key for tokens")
     token_salt: str = Field(..., description="Salt for token encryption")
@@ -90,6 +120,11 @@ class Settings(BaseSettings):
             raise ValueError(f"Log level must be one of {valid_levels}")
         return v_upper
     
+    @cached_property
+    def fernet(self) -> Fernet:
+        """Get the Fernet cipher for the encryption key (built once)."""
+        return Fernet(self.encryption_key.encode())
+    
     @property
     def config_dir(self) -> Path:
         """Get the configuration directory path."""
@@ -100,20 +135,18 @@ class Settings(BaseSettings):
         """Get the agent registry YAML file path."""
         return self.config_dir / "agent_registry.yaml"
     
-    def get_gmail_scopes(self) -> list[str]:
+    def get_gmail_scopes(self) -> tuple[str, ...]:
         """Get Gmail OAuth scopes."""
-        return [
-            "https://www.googleapis.com/auth/gmail.readonly",
-            "https://www.googleapis.com/auth/gmail.send"
-        ]
+        return GMAIL_SCOPES
     
-    def get_github_scopes(self) -> list[str]:
+    def get_github_scopes(self) -> tuple[str, ...]:
         """Get GitHub OAuth scopes."""
-        return ["repo", "read:user"]
+        return GITHUB_SCOPES
 
 
 # Singleton instance
 _settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
@@ -128,7 +161,10 @@ def get_settings() -> Settings:
     """
     global _settings
     if _settings is None:
-        _settings = Settings()
+        # Agents are created on worker threads; build the instance only once
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
     return _settings
 
 
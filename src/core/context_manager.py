@@ -4,8 +4,11 @@ Manages execution state, task results, and context data.
 """
 
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+import time
+from concurrent.futures import Executor
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, Mapping, Optional, Tuple
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +20,26 @@ class ExecutionContext:
     Stores task results and provides access to them for dependent tasks.
     """
     
-    def __init__(self, session_id: str, user_id: str, user_input: str):
+    __slots__ = (
+        'session_id',
+        'user_id',
+        'user_input',
+        'executor',
+        'task_results',
+        '_results_view',
+        'start_time',
+        '_start_ns',
+        '_succeeded',
+        '_failed',
+    )
+    
+    def __init__(
+        self,
+        session_id: str,
+        user_id: str,
+        user_input: str,
+        executor: Optional[Executor] = None
+    ):
         """
         Initialize execution context.
         
@@ -25,14 +47,23 @@ class ExecutionContext:
             session_id: Session identifier
             user_id: User identifier
             user_input: Original user input
+            executor: Shared executor for parallel tasks (optional)
         """
         self.session_id = session_id
         self.user_id = user_id
         self.user_input = user_input
+        self.executor = executor
         self.task_results: Dict[str, Dict[str, Any]] = {}
-        self.start_time = datetime.utcnow()
+        self._results_view = MappingProxyType(self.task_results)
+        self.start_time = datetime.now(timezone.utc)
+        self._start_ns = time.monotonic_ns()
+        
+        # Task IDs by outcome, kept up to date by store_result (dicts keep
+        # completion order)
+        self._succeeded: Dict[str, None] = {}
+        self._failed: Dict[str, None] = {}
         
-        logger.info(f"Created execution context for session {session_id}")
+        logger.info("Created execution context for session %s", session_id)
     
     def store_result(self, task_id: str, result: Dict[str, Any]) -> None:
         """
@@ -43,7 +74,18 @@ class ExecutionContext:
             result: Task execution result
         """
         self.task_results[task_id] = result
-        logger.debug(f"Stored result for task {task_id}")
+        
+        self._succeeded.pop(task_id, None)
+        self._failed.pop(task_id, None)
+        
+        status = result.get('status')
+        if status == 'success':
+            self._succeeded[task_id] = None
+        elif status == 'error':
+            self._failed[task_id] = None
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Stored result for task %s", task_id)
     
     def get_result(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -57,14 +99,59 @@ class ExecutionContext:
         """
         return self.task_results.get(task_id)
     
-    def get_all_results(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_results(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Get all task results as a live, read-only view.
+        
+        The view reflects results stored later; use snapshot_results() for
+        a copy that does not change.
+        
+        Returns:
+            Mapping: All task results (task_id -> result)
+        """
+        return self._results_view
+    
+    def snapshot_results(self) -> Dict[str, Dict[str, Any]]:
         """
-        Get all task results.
+        Get a copy of all task results.
         
         Returns:
-            dict: All task results (task_id -> result)
+            dict: All task results (task_id -> result) as of this call
+        """
+        return dict(self.task_results)
+    
+    def iter_task_results(self, tasks: Iterable[Any]) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """
+        Iterate over tasks that have a stored result, in the given order.
+        
+        Args:
+            tasks: Task objects to look up
+            
+        Yields:
+            tuple: (task, result) for each task with a result
         """
-        return self.task_results.copy()
+        for task in tasks:
+            result = self.task_results.get(task.id)
+            if result:
+                yield task, result
+    
+    def iter_result_summaries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over lightweight summaries of task results.
+        
+        Yields:
+            dict: Task ID, status, size of the result data, and error
+            message without the result data itself
+        """
+        for task_id, result in self.task_results.items():
+            data = result.get('data')
+            error = result.get('error')
+            yield {
+                'task_id': task_id,
+                'status': result.get('status'),
+                'size': len(data) if data is not None else 0,
+                'error': error.get('message') if error else None
+            }
     
     def get_execution_time(self) -> float:
         """
@@ -73,7 +160,7 @@ class ExecutionContext:
         Returns:
             float: Execution time in seconds
         """
-        return (datetime.utcnow() - self.start_time).total_seconds()
+        return (time.monotonic_ns() - self._start_ns) / 1e9
     
     def get_successful_tasks(self) -> list[str]:
         """
@@ -82,10 +169,7 @@ class ExecutionContext:
         Returns:
             list: Task IDs that succeeded
         """
-        return [
-            task_id for task_id, result in self.task_results.items()
-            if result.get('status') == 'success'
-        ]
+        return list(self._succeeded)
     
     def get_failed_tasks(self) -> list[str]:
         """
@@ -94,10 +178,7 @@ class ExecutionContext:
         Returns:
             list: Task IDs that failed
         """
-        return [
-            task_id for task_id, result in self.task_results.items()
-            if result.get('status') == 'error'
-        ]
+        return list(self._failed)
     
     def has_failures(self) -> bool:
         """
@@ -106,7 +187,7 @@ class ExecutionContext:
         Returns:
             bool: True if any tasks failed
         """
-        return len(self.get_failed_tasks()) > 0
+        return bool(self._failed)
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -116,8 +197,8 @@ class ExecutionContext:
             dict: Execution summary with stats
         """
         total_tasks = len(self.task_results)
-        successful = len(self.get_successful_tasks())
-        failed = len(self.get_failed_tasks())
+        successful = len(self._succeeded)
+        failed = len(self._failed)
         
         return {
             'session_id': self.session_id,
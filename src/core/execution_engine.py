@@ -4,21 +4,24 @@ Handles parallel and sequential task execution with dependency management.
 """
 
 import logging
-import asyncio
+import time
+from collections import defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from src.database import Task, ExecutionPlan, update_task_status
-from src.agents import GmailAgent, GitHubAgent
 from .context_manager import ExecutionContext
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Worker threads for contexts created without a session executor
+_MAX_WORKERS = 32
+
 
 class ExecutionEngine:
     """
@@ -29,8 +32,35 @@ class ExecutionEngine:
     
     def __init__(self):
         """Initialize the execution engine."""
+        self._pool: Optional[ThreadPoolExecutor] = None
         logger.info("Execution engine initialized")
     
+    def _get_executor(self, context: ExecutionContext) -> Executor:
+        """
+        Get the executor to run a context's tasks on.
+        
+        Args:
+            context: Execution context
+            
+        Returns:
+            Executor: The session's executor, or the engine's own pool
+        """
+        if context.executor is not None:
+            return context.executor
+        
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_MAX_WORKERS,
+                thread_name_prefix="vienna-exec"
+            )
+        return self._pool
+    
+    def shutdown(self) -> None:
+        """Shut down the engine's own worker pool, if it was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
     def execute(
         self,
         execution_plan: ExecutionPlan,
@@ -84,25 +114,33 @@ class ExecutionEngine:
             tasks: List of tasks
             
         Returns:
-            dict: Task graph with nodes, edges, and independent tasks
+            dict: Task graph with nodes, edges, in-degrees, and independent tasks
         """
-        graph = {
-            "nodes": {task.id: task for task in tasks},
-            "edges": {},  # task_id -> list of dependent task_ids
-            "independent": []  # tasks with no dependencies
-        }
+        nodes = {}
+        edges = defaultdict(list)  # task_id -> list of dependent task_ids
+        in_degree = {}  # task_id -> number of dependencies
+        independent = []  # tasks with no dependencies
         
-        # Build edges and find independent tasks
+        # Build everything in one pass over the tasks
         for task in tasks:
-            if not task.dependencies:
-                graph["independent"].append(task.id)
+            task_id = task.id
+            dependencies = task.dependencies
+            
+            nodes[task_id] = task
+            in_degree[task_id] = len(dependencies)
+            
+            if not dependencies:
+                independent.append(task_id)
             else:
-                for dep in task.dependencies:
-                    if dep not in graph["edges"]:
-                        graph["edges"][dep] = []
-                    graph["edges"][dep].append(task.id)
-        
-        return graph
+                for dep in dependencies:
+                    edges[dep].append(task_id)
+        
+        return {
+            "nodes": nodes,
+            "edges": edges,
+            "in_degree": in_degree,
+            "independent": independent
+        }
     
     def _topological_sort(self, graph: Dict[str, Any]) -> List[str]:
         """
@@ -117,19 +155,15 @@ class ExecutionEngine:
         Raises:
             ValueError: If circular dependency detected
         """
-        # Calculate in-degrees
-        in_degree = {node: 0 for node in graph["nodes"]}
-        
-        for task_id, dependents in graph["edges"].items():
-            for dependent in dependents:
-                in_degree[dependent] += 1
+        # Work on a copy of the precomputed in-degrees
+        in_degree = dict(graph["in_degree"])
         
         # Queue of tasks with no dependencies
-        queue = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        queue = deque(graph["independent"])
         sorted_tasks = []
         
         while queue:
-            task_id = queue.pop(0)
+            task_id = queue.popleft()
             sorted_tasks.append(task_id)
             
             # Reduce in-degree for dependents
@@ -243,9 +277,12 @@ class ExecutionEngine:
         Raises:
             ValueError: If agent type is unknown
         """
+        # Agents are imported on first use to keep their API clients off startup
         if agent_type == "gmail":
+            from src.agents import GmailAgent
             return GmailAgent(user_id)
         elif agent_type == "github":
+            from src.agents import GitHubAgent
             return GitHubAgent(user_id)
         else:
             raise ValueError(f"Unknown agent type: {agent_type}")
@@ -273,64 +310,25 @@ class ExecutionEngine:
             )
         )
         
-        # Execute using asyncio
-        results = asyncio.run(self._execute_parallel_async(tasks, context))
-        
-        # Display summary
-        self._display_summary(context)
-        
-        return results
-    
-    async def _execute_parallel_async(
-        self,
-        tasks: List[Task],
-        context: ExecutionContext
-    ) -> List[Dict[str, Any]]:
-        """
-        Execute tasks in parallel using asyncio.
-        
-        Args:
-            tasks: List of tasks
-            context: Execution context
-            
-        Returns:
-            list: List of results
-        """
-        # Create async tasks
-        async_tasks = [
-            self._execute_task_async(task, context)
+        # Agent operations are blocking I/O; run them on the worker threads
+        executor = self._get_executor(context)
+        futures = [
+            executor.submit(self._execute_task_sync, task, context)
             for task in tasks
         ]
         
-        # Execute all in parallel, capturing exceptions
-        results = await asyncio.gather(*async_tasks, return_exceptions=True)
+        # Collect in task order, capturing exceptions like gather did
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
         
-        return results
-    
-    async def _execute_task_async(
-        self,
-        task: Task,
-        context: ExecutionContext
-    ) -> Dict[str, Any]:
-        """
-        Execute a single task asynchronously.
+        # Display summary
+        self._display_summary(context)
         
-        Args:
-            task: Task to execute
-            context: Execution context
-            
-        Returns:
-            dict: Task result
-        """
-        # Run in thread pool since agent operations are synchronous
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._execute_task_sync,
-            task,
-            context
-        )
-        return result
+        return results
     
     def _execute_task_sync(
         self,
@@ -371,7 +369,7 @@ class ExecutionEngine:
                 )
                 console.print(
                     f"✓ [green]{task.agent_type}.{task.mode} completed[/green] "
-                    f"({result['metadata']['execution_time']:.2f}s)"
+                    f"({result['metadata']['execution_time_ms'] / 1000:.2f}s)"
                 )
             else:
                 update_task_status(
@@ -394,8 +392,8 @@ class ExecutionEngine:
                 'status': 'error',
                 'data': None,
                 'metadata': {
-                    'execution_time': 0,
-                    'timestamp': datetime.utcnow().isoformat()
+                    'execution_time_ms': 0,
+                    'timestamp_ns': time.time_ns()
                 },
                 'error': {
                     'type': type(e).__name__,
@@ -422,7 +420,7 @@ class ExecutionEngine:
         graph: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """
-        Execute tasks sequentially based on dependencies.
+        Execute tasks in dependency order, each as soon as its dependencies finish.
         
         Args:
             execution_plan: Execution plan
@@ -430,7 +428,7 @@ class ExecutionEngine:
             graph: Task dependency graph
             
         Returns:
-            list: List of results
+            list: List of results, in completion order
         """
         console.print(
             Panel(
@@ -440,113 +438,153 @@ class ExecutionEngine:
             )
         )
         
-        # Get execution order using topological sort
+        # Reject circular dependencies before starting any task
         try:
-            ordered_task_ids = self._topological_sort(graph)
+            self._topological_sort(graph)
         except ValueError as e:
             logger.error(f"Cannot execute sequential plan: {e}")
             console.print(f"[red]Error: {e}[/red]")
             raise
         
+        # Start each task as soon as its last dependency finishes, so a slow
+        # task only delays the tasks that depend on it
+        executor = self._get_executor(context)
+        remaining = dict(graph['in_degree'])
+        ready = deque(graph['independent'])
+        pending = {}
         results = []
         
-        # Execute in order
-        for task_id in ordered_task_ids:
-            task = graph['nodes'][task_id]
+        while ready or pending:
+            while ready:
+                task_id = ready.popleft()
+                future = executor.submit(
+                    self._execute_dependent_task,
+                    graph['nodes'][task_id],
+                    context
+                )
+                pending[future] = task_id
             
-            console.print(f"\n[bold]Executing: {task_id}[/bold]")
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
             
-            # Check if dependencies succeeded
-            if task.dependencies:
-                failed_deps = []
-                for dep_id in task.dependencies:
-                    dep_result = context.get_result(dep_id)
-                    if not dep_result or dep_result.get('status') != 'success':
-                        failed_deps.append(dep_id)
+            for future in done:
+                task_id = pending.pop(future)
+                results.append(future.result())
                 
-                if failed_deps:
-                    error_msg = (
-                        f"Cannot execute {task_id}: "
-                        f"dependency {', '.join(failed_deps)} failed"
-                    )
-                    logger.error(error_msg)
-                    console.print(f"[red]⚠ {error_msg}[/red]")
-                    
-                    # Store error result
-                    error_result = {
-                        'status': 'error',
-                        'data': None,
-                        'metadata': {
-                            'execution_time': 0,
-                            'timestamp': datetime.utcnow().isoformat()
-                        },
-                        'error': {
-                            'type': 'DependencyError',
-                            'message': error_msg
-                        }
-                    }
-                    context.store_result(task_id, error_result)
-                    update_task_status(task_id, status='failed', error=error_msg)
-                    results.append(error_result)
-                    
-                    # Continue to next task (don't break - show all dependency failures)
-                    continue
-            
-            # Extract required data from previous tasks
-            if task.required_inputs:
-                try:
-                    extracted_data = self._extract_required_data(
-                        context,
-                        task.required_inputs
-                    )
-                    
-                    # Fill templates in parameters
-                    for param_name, param_value in task.parameters.items():
-                        if isinstance(param_value, str) and "{" in param_value:
-                            # This is a template, fill it
-                            task.parameters[param_name] = self._fill_template(
-                                param_value,
-                                extracted_data
-                            )
-                        elif param_name in extracted_data:
-                            # Direct replacement
-                            task.parameters[param_name] = extracted_data[param_name]
-                    
-                    logger.info(f"Filled parameters for {task_id}: {task.parameters}")
-                    
-                except Exception as e:
-                    logger.error(f"Error extracting data for {task_id}: {e}")
-                    console.print(f"[red]Error extracting data: {e}[/red]")
-                    
-                    error_result = {
-                        'status': 'error',
-                        'data': None,
-                        'metadata': {
-                            'execution_time': 0,
-                            'timestamp': datetime.utcnow().isoformat()
-                        },
-                        'error': {
-                            'type': 'DataExtractionError',
-                            'message': f"Failed to extract required data: {e}"
-                        }
-                    }
-                    context.store_result(task_id, error_result)
-                    results.append(error_result)
-                    continue
-            
-            # Execute task
-            result = self._execute_task_sync(task, context)
-            results.append(result)
-            
-            # Update task object
-            task.result = result
-            task.status = "completed" if result["status"] == "success" else "failed"
+                for dependent in graph['edges'].get(task_id, ()):
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        ready.append(dependent)
         
         # Display summary
         self._display_summary(context)
         
         return results
     
+    def _execute_dependent_task(
+        self,
+        task: Task,
+        context: ExecutionContext
+    ) -> Dict[str, Any]:
+        """
+        Execute a task whose dependencies have all finished.
+        
+        Fails the task without running it if a dependency failed, and fills
+        its parameters from dependency results first.
+        
+        Args:
+            task: Task to execute
+            context: Execution context
+            
+        Returns:
+            dict: Task result
+        """
+        task_id = task.id
+        
+        console.print(f"\n[bold]Executing: {task_id}[/bold]")
+        
+        # Check if dependencies succeeded
+        if task.dependencies:
+            failed_deps = []
+            for dep_id in task.dependencies:
+                dep_result = context.get_result(dep_id)
+                if not dep_result or dep_result.get('status') != 'success':
+                    failed_deps.append(dep_id)
+            
+            if failed_deps:
+                error_msg = (
+                    f"Cannot execute {task_id}: "
+                    f"dependency {', '.join(failed_deps)} failed"
+                )
+                logger.error(error_msg)
+                console.print(f"[red]⚠ {error_msg}[/red]")
+                
+                # Store error result
+                error_result = {
+                    'status': 'error',
+                    'data': None,
+                    'metadata': {
+                        'execution_time_ms': 0,
+                        'timestamp_ns': time.time_ns()
+                    },
+                    'error': {
+                        'type': 'DependencyError',
+                        'message': error_msg
+                    }
+                }
+                context.store_result(task_id, error_result)
+                update_task_status(task_id, status='failed', error=error_msg)
+                return error_result
+        
+        # Extract required data from previous tasks
+        if task.required_inputs:
+            try:
+                extracted_data = self._extract_required_data(
+                    context,
+                    task.required_inputs
+                )
+                
+                # Fill templates in parameters
+                for param_name, param_value in task.parameters.items():
+                    if isinstance(param_value, str) and "{" in param_value:
+                        # This is a template, fill it
+                        task.parameters[param_name] = self._fill_template(
+                            param_value,
+                            extracted_data
+                        )
+                    elif param_name in extracted_data:
+                        # Direct replacement
+                        task.parameters[param_name] = extracted_data[param_name]
+                
+                logger.info(f"Filled parameters for {task_id}: {task.parameters}")
+                
+            except Exception as e:
+                logger.error(f"Error extracting data for {task_id}: {e}")
+                console.print(f"[red]Error extracting data: {e}[/red]")
+                
+                error_result = {
+                    'status': 'error',
+                    'data': None,
+                    'metadata': {
+                        'execution_time_ms': 0,
+                        'timestamp_ns': time.time_ns()
+                    },
+                    'error': {
+                        'type': 'DataExtractionError',
+                        'message': f"Failed to extract required data: {e}"
+                    }
+                }
+                context.store_result(task_id, error_result)
+                return error_result
+        
+        # Execute task
+        result = self._execute_task_sync(task, context)
+        
+        # Update task object
+        task.result = result
+        task.status = "completed" if result["status"] == "success" else "failed"
+        
+        return result
+    
     def _display_summary(self, context: ExecutionContext) -> None:
         """
         Display execution summary.
@@ -1,6 +1,7 @@
 """Database module for Vienna AI Agent Orchestration System."""
 
 from .mongodb_client import MongoDBClient, get_db_client, get_database
+from .background_writer import BackgroundWriter, get_background_writer
 from .models import (
     # Pydantic models
     Task,
@@ -10,6 +11,7 @@ from .models import (
     CREDENTIALS_COLLECTION,
     SESSIONS_COLLECTION,
     TASKS_COLLECTION,
+    TASK_RESULTS_COLLECTION,
     # User operations
     get_user,
     create_user,
@@ -17,6 +19,7 @@ from .models import (
     # Credentials operations
     store_credentials,
     get_credentials,
+    get_credentials_bulk,
     delete_credentials,
     # Session operations
     create_session,
@@ -25,6 +28,7 @@ from .models import (
     get_user_sessions,
     # Task operations
     create_task,
+    store_task_results,
     update_task_status,
     get_task,
     get_session_tasks,
@@ -41,11 +45,15 @@ __all__ = [
     "MongoDBClient",
     "get_db_client",
     "get_database",
+    # Background writes
+    "BackgroundWriter",
+    "get_background_writer",
     # Collection names
     "USERS_COLLECTION",
     "CREDENTIALS_COLLECTION",
     "SESSIONS_COLLECTION",
     "TASKS_COLLECTION",
+    "TASK_RESULTS_COLLECTION",
     # User operations
     "get_user",
     "create_user",
@@ -53,6 +61,7 @@ __all__ = [
     # Credentials operations
     "store_credentials",
     "get_credentials",
+    "get_credentials_bulk",
     "delete_credentials",
     # Session operations
     "create_session",
@@ -61,6 +70,7 @@ __all__ = [
     "get_user_sessions",
     # Task operations
     "create_task",
+    "store_task_results",
     "update_task_status",
     "get_task",
     "get_session_tasks",
@@ -0,0 +1,110 @@
+"""
+Background writer for Vienna AI Agent Orchestration System.
+Runs database writes on a daemon thread so they stay off the REPL's critical path.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel that tells the worker thread to stop
+_STOP = object()
+
+
+class BackgroundWriter:
+    """
+    Executes submitted write operations in order on a single daemon thread.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the writer and start its worker thread.
+        
+        Args:
+            maxsize: Maximum number of pending writes before callers write inline
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._drain,
+            name="vienna-db-writer",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """
+        Queue a write operation.
+        
+        If the queue is full the operation runs inline on the caller's thread
+        so that no write is dropped.
+        
+        Args:
+            func: Database operation to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        """
+        try:
+            self._queue.put_nowait((func, args, kwargs))
+        except queue.Full:
+            logger.warning("Background write queue full, writing inline")
+            self._run(func, args, kwargs)
+    
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """
+        Flush pending writes and stop the worker thread.
+        
+        Args:
+            timeout: Seconds to wait for pending writes to finish
+        """
+        if not self._thread.is_alive():
+            return
+        
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        
+        if self._thread.is_alive():
+            logger.warning("Background writer did not finish pending writes in time")
+    
+    def _drain(self) -> None:
+        """Run queued operations until the stop sentinel is received."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            
+            func, args, kwargs = item
+            self._run(func, args, kwargs)
+    
+    @staticmethod
+    def _run(func: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        """Run a single operation, logging instead of raising on failure."""
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            logger.error(
+                "Background write %s failed: %s",
+                getattr(func, "__name__", func),
+                e,
+                exc_info=True
+            )
+
+
+# Singleton accessor function
+_background_writer: Optional[BackgroundWriter] = None
+
+
+def get_background_writer() -> BackgroundWriter:
+    """
+    Get the singleton BackgroundWriter instance.
+    
+    Returns:
+        BackgroundWriter: The background writer instance
+    """
+    global _background_writer
+    if _background_writer is None:
+        _background_writer = BackgroundWriter()
+    return _background_writer
@@ -6,9 +6,10 @@ Also includes Pydantic models for task execution.
 
 import logging
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import uuid4
 
+from pymongo import IndexModel
 from pymongo.errors import DuplicateKeyError, PyMongoError
 from pydantic import BaseModel, Field
 
@@ -123,6 +124,7 @@ USERS_COLLECTION = "users"
 CREDENTIALS_COLLECTION = "credentials"
 SESSIONS_COLLECTION = "sessions"
 TASKS_COLLECTION = "tasks"
+TASK_RESULTS_COLLECTION = "task_results"
 
 
 # ============================================================================
@@ -176,8 +178,8 @@ def create_user(user_id: str, email: str, preferences: Optional[Dict[str, Any]]
         user_doc = {
             "user_id": user_id,
             "email": email,
-            "created_at": datetime.utcnow(),
-            "last_login": datetime.utcnow(),
+            "created_at": datetime.now(timezone.utc),
+            "last_login": datetime.now(timezone.utc),
             "preferences": default_preferences
         }
         
@@ -209,7 +211,7 @@ def update_user_login(user_id: str) -> bool:
         db = get_database()
         result = db[USERS_COLLECTION].update_one(
             {"user_id": user_id},
-            {"$set": {"last_login": datetime.utcnow()}}
+            {"$set": {"last_login": datetime.now(timezone.utc)}}
         )
         return result.modified_count > 0
     except PyMongoError as e:
@@ -226,7 +228,7 @@ def store_credentials(
     service: str,
     encrypted_token: str,
     encrypted_refresh_token: Optional[str] = None,
-    token_expiry: Optional[datetime] = None
+    token_expiry: Optional[float] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Store or update encrypted credentials for a service.
@@ -236,7 +238,7 @@ def store_credentials(
         service: Service name (gmail, github)
         encrypted_token: Encrypted access token
         encrypted_refresh_token: Encrypted refresh token (optional)
-        token_expiry: Token expiration datetime (optional)
+        token_expiry: Token expiration as a POSIX timestamp (optional)
         
     Returns:
         Stored credentials document or None if failed
@@ -250,8 +252,8 @@ def store_credentials(
             "encrypted_token": encrypted_token,
             "encrypted_refresh_token": encrypted_refresh_token,
             "token_expiry": token_expiry,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         }
         
         # Use upsert to update if exists, insert if not
@@ -294,6 +296,29 @@ def get_credentials(user_id: str, service: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_credentials_bulk(user_id: str, services: List[str]) -> set[str]:
+    """
+    Find which services have stored credentials in a single query.
+    
+    Args:
+        user_id: User identifier
+        services: Service names to look up (gmail, github)
+        
+    Returns:
+        Set of service names that have credentials stored
+    """
+    try:
+        db = get_database()
+        cursor = db[CREDENTIALS_COLLECTION].find(
+            {"user_id": user_id, "service": {"$in": services}},
+            {"service": 1, "_id": 0}
+        )
+        return {doc["service"] for doc in cursor}
+    except PyMongoError as e:
+        logger.error(f"Error retrieving credentials for user {user_id}, services {services}: {e}")
+        return set()
+
+
 def delete_credentials(user_id: str, service: str) -> bool:
     """
     Delete credentials for a service.
@@ -338,8 +363,8 @@ def create_session(user_id: str) -> Optional[Dict[str, Any]]:
         session_doc = {
             "session_id": str(uuid4()),
             "user_id": user_id,
-            "created_at": datetime.utcnow(),
-            "last_interaction": datetime.utcnow(),
+            "created_at": datetime.now(timezone.utc),
+            "last_interaction": datetime.now(timezone.utc),
             "conversation_history": []
         }
         
@@ -357,7 +382,8 @@ def create_session(user_id: str) -> Optional[Dict[str, Any]]:
 def update_session(
     session_id: str,
     user_input: str,
-    system_response: str
+    system_response: str,
+    timestamp: Optional[datetime] = None
 ) -> bool:
     """
     Add an interaction to session conversation history.
@@ -366,6 +392,7 @@ def update_session(
         session_id: Session identifier
         user_input: User's input text
         system_response: System's response text
+        timestamp: Time of the interaction (default: now)
         
     Returns:
         True if updated successfully, False otherwise
@@ -373,8 +400,11 @@ def update_session(
     try:
         db = get_database()
         
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+        
         interaction = {
-            "timestamp": datetime.utcnow(),
+            "timestamp": timestamp,
             "user_input": user_input,
             "system_response": system_response
         }
@@ -383,7 +413,7 @@ def update_session(
             {"session_id": session_id},
             {
                 "$push": {"conversation_history": interaction},
-                "$set": {"last_interaction": datetime.utcnow()}
+                "$set": {"last_interaction": timestamp}
             }
         )
         
@@ -449,7 +479,10 @@ def create_task(
     session_id: str,
     user_id: str,
     user_input: str,
-    execution_plan: Dict[str, Any]
+    execution_plan: Dict[str, Any],
+    status: str = "pending",
+    results: Optional[Dict[str, Any]] = None,
+    created_at: Optional[datetime] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Create a new task record.
@@ -459,6 +492,9 @@ def create_task(
         user_id: User identifier
         user_input: User's input command
         execution_plan: Planned execution details
+        status: Initial status (default: pending)
+        results: Per-task result summaries (optional)
+        created_at: Creation time (default: now)
         
     Returns:
         Created task document or None if failed
@@ -472,10 +508,10 @@ def create_task(
             "user_id": user_id,
             "user_input": user_input,
             "execution_plan": execution_plan,
-            "status": "pending",
-            "results": {},
+            "status": status,
+            "results": results or {},
             "error": None,
-            "created_at": datetime.utcnow(),
+            "created_at": created_at or datetime.now(timezone.utc),
             "completed_at": None,
             "execution_time_ms": None
         }
@@ -491,6 +527,54 @@ def create_task(
         return None
 
 
+def store_task_results(
+    task_id: str,
+    session_id: str,
+    results: Dict[str, Dict[str, Any]],
+    created_at: Optional[datetime] = None
+) -> bool:
+    """
+    Store full agent result payloads for a task record.
+    
+    Payloads are kept out of the task document so that listing tasks
+    stays cheap; all of them are written with a single insert_many.
+    
+    Args:
+        task_id: Task record identifier
+        session_id: Session identifier
+        results: Mapping of plan task ID -> agent result
+        created_at: Creation time (default: now)
+        
+    Returns:
+        True if stored successfully, False otherwise
+    """
+    if not results:
+        return True
+    
+    try:
+        db = get_database()
+        created_at = created_at or datetime.now(timezone.utc)
+        
+        result_docs = [
+            {
+                "task_id": task_id,
+                "session_id": session_id,
+                "plan_task_id": plan_task_id,
+                "status": result.get("status"),
+                "data": result.get("data"),
+                "created_at": created_at
+            }
+            for plan_task_id, result in results.items()
+        ]
+        
+        db[TASK_RESULTS_COLLECTION].insert_many(result_docs, ordered=False)
+        return True
+        
+    except PyMongoError as e:
+        logger.error(f"Error storing results for task {task_id}: {e}")
+        return False
+
+
 def update_task_status(
     task_id: str,
     status: str,
@@ -527,10 +611,14 @@ def update_task_status(
             update_fields["error"] = error
         
         if status in ["completed", "failed"]:
-            update_fields["completed_at"] = datetime.utcnow()
-            # Calculate execution time
-            if task.get("created_at"):
-                execution_time = (datetime.utcnow() - task["created_at"]).total_seconds() * 1000
+            completed_at = datetime.now(timezone.utc)
+            update_fields["completed_at"] = completed_at
+            # Calculate execution time (the driver returns naive UTC datetimes)
+            created_at = task.get("created_at")
+            if created_at:
+                if created_at.tzinfo is None:
+                    created_at = created_at.replace(tzinfo=timezone.utc)
+                execution_time = (completed_at - created_at).total_seconds() * 1000
                 update_fields["execution_time_ms"] = int(execution_time)
         
         result = db[TASKS_COLLECTION].update_one(
@@ -621,44 +709,61 @@ def get_tasks_by_status(status: str, limit: int = 100) -> List[Dict[str, Any]]:
 # Index Creation
 # ============================================================================
 
+# Set once indexes have been created in this process
+_indexes_created = False
+
+
 def create_indexes() -> bool:
     """
     Create all required database indexes for performance.
     
+    Indexes are sent in one createIndexes command per collection, and only
+    once per process; later calls return immediately after a success.
+    
     Returns:
         True if indexes created successfully, False otherwise
     """
+    global _indexes_created
+    if _indexes_created:
+        return True
+    
     try:
         db = get_database()
         
         # Users collection indexes
-        db[USERS_COLLECTION].create_index("user_id", unique=True)
+        db[USERS_COLLECTION].create_indexes([
+            IndexModel("user_id", unique=True)
+        ])
         logger.info("Created index: users.user_id (unique)")
         
         # Credentials collection indexes
-        db[CREDENTIALS_COLLECTION].create_index(
-            [("user_id", 1), ("service", 1)],
-            unique=True
-        )
+        db[CREDENTIALS_COLLECTION].create_indexes([
+            IndexModel([("user_id", 1), ("service", 1)], unique=True)
+        ])
         logger.info("Created index: credentials.user_id + service (compound, unique)")
         
         # Sessions collection indexes
-        db[SESSIONS_COLLECTION].create_index("session_id", unique=True)
-        logger.info("Created index: sessions.session_id (unique)")
-        
-        db[SESSIONS_COLLECTION].create_index("user_id")
-        logger.info("Created index: sessions.user_id")
+        db[SESSIONS_COLLECTION].create_indexes([
+            IndexModel("session_id", unique=True),
+            IndexModel("user_id")
+        ])
+        logger.info("Created indexes: sessions.session_id (unique), sessions.user_id")
         
         # Tasks collection indexes
-        db[TASKS_COLLECTION].create_index("task_id", unique=True)
-        logger.info("Created index: tasks.task_id (unique)")
-        
-        db[TASKS_COLLECTION].create_index("session_id")
-        logger.info("Created index: tasks.session_id")
-        
-        db[TASKS_COLLECTION].create_index("status")
-        logger.info("Created index: tasks.status")
-        
+        db[TASKS_COLLECTION].create_indexes([
+            IndexModel("task_id", unique=True),
+            IndexModel("session_id"),
+            IndexModel("status")
+        ])
+        logger.info("Created indexes: tasks.task_id (unique), tasks.session_id, tasks.status")
+        
+        # Task results collection indexes
+        db[TASK_RESULTS_COLLECTION].create_indexes([
+            IndexModel("task_id")
+        ])
+        logger.info("Created index: task_results.task_id")
+        
+        _indexes_created = True
         logger.info("All database indexes created successfully")
         return True
         
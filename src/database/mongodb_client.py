@@ -5,11 +5,13 @@ Provides singleton access to MongoDB Atlas with connection pooling and health ch
 
 import logging
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
-from pymongo import MongoClient
+from pymongo import MongoClient, uri_parser
 from pymongo.errors import (
+    ConfigurationError,
     ConnectionFailure,
+    InvalidURI,
     ServerSelectionTimeoutError,
 )
 
@@ -19,6 +21,36 @@ from ..config import get_settings
 logger = logging.getLogger(__name__)
 
 
+def _is_single_host_uri(uri: str) -> bool:
+    """
+    Check whether a MongoDB URI targets exactly one plain host.
+    
+    SRV URIs, URIs the driver rejects, and URIs that already set
+    replicaSet, directConnection or loadBalanced are left to the driver's
+    defaults.
+    
+    Args:
+        uri: MongoDB connection string
+        
+    Returns:
+        bool: True if the URI names a single host
+    """
+    # Parsing an SRV URI would resolve its DNS records
+    if not uri.startswith("mongodb://"):
+        return False
+    
+    try:
+        parsed = uri_parser.parse_uri(uri)
+    except (InvalidURI, ConfigurationError, ValueError):
+        return False
+    
+    options = parsed['options']
+    if any(name in options for name in ('replicaSet', 'directConnection', 'loadBalanced')):
+        return False
+    
+    return len(parsed['nodelist']) == 1
+
+
 class MongoDBClient:
     """
     Singleton MongoDB client with connection pooling and health checks.
@@ -43,15 +75,21 @@ class MongoDBClient:
         try:
             settings = get_settings()
             
+            # Connect straight to a lone host instead of running replica-set discovery
+            extra_options = {}
+            if _is_single_host_uri(settings.mongodb_uri):
+                extra_options['directConnection'] = True
+            
             # Create MongoDB client with connection pooling
             self._client = MongoClient(
                 settings.mongodb_uri,
-                maxPoolSize=50,  # Maximum number of connections in the pool
-                minPoolSize=10,  # Minimum number of connections in the pool
+                maxPoolSize=settings.db_max_pool_size,  # Maximum number of connections in the pool
+                minPoolSize=settings.db_min_pool_size,  # Connections pre-opened in the background
                 maxIdleTimeMS=30000,  # Close connections after 30 seconds of inactivity
                 serverSelectionTimeoutMS=5000,  # 5 second timeout for server selection
                 connectTimeoutMS=10000,  # 10 second connection timeout
                 socketTimeoutMS=20000,  # 20 second socket timeout
+                **extra_options,
             )
             
             # Verify connection
@@ -101,9 +139,9 @@ class MongoDBClient:
         """
         try:
             # Ping the database
-            start_time = datetime.utcnow()
+            start_time = datetime.now(timezone.utc)
             self.client.admin.command('ping')
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
             
             # Get server status
             server_status = self.client.admin.command('serverStatus')
@@ -114,7 +152,7 @@ class MongoDBClient:
                 "database": get_settings().database_name,
                 "connections": server_status.get('connections', {}),
                 "uptime_seconds": server_status.get('uptime', 0),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
         except (ConnectionFailure, ServerSelectionTimeoutError) as e:
@@ -122,14 +160,14 @@ class MongoDBClient:
             return {
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
         except Exception as e:
             logger.error(f"Unexpected error during health check: {e}")
             return {
                 "status": "error",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.now(timezone.utc).isoformat()
             }
     
     def close(self) -> None:
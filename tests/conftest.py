@@ -0,0 +1,27 @@
+"""Shared fixtures for the Vienna test suite."""
+
+import pytest
+from cryptography.fernet import Fernet
+
+import src.config.agent_registry as agent_registry_module
+import src.config.settings as settings_module
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch):
+    """Provide the required settings and reset the config singletons."""
+    env = {
+        "MONGODB_URI": "mongodb://localhost:27017",
+        "ANTHROPIC_API_KEY": "sk-ant-test",
+        "GMAIL_CLIENT_ID": "gmail-client-id",
+        "GMAIL_CLIENT_SECRET": "gmail-client-secret",
+        "GITHUB_CLIENT_ID": "github-client-id",
+        "GITHUB_CLIENT_SECRET": "github-client-secret",
+        "ENCRYPTION_KEY": Fernet.generate_key().decode(),
+        "TOKEN_SALT": "test-salt",
+    }
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    monkeypatch.setattr(settings_module, "_settings", None)
+    monkeypatch.setattr(agent_registry_module, "_agent_registry", None)
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""Tests for the agent registry loader."""
+
+import threading
+
+import pytest
+
+import src.config.agent_registry as agent_registry_module
+from src.config import AgentRegistry, get_agent_registry
+
+
+def test_shipped_registry_loads():
+    registry = get_agent_registry()
+
+    assert registry.get_agent_modes("gmail") == ("read", "send", "search")
+    assert registry.get_agent_modes("github") == ("list_repos", "get_repo")
+
+    assert registry.get_required_parameters("gmail", "send") == ["to", "subject", "body"]
+    assert registry.get_required_parameters("github", "get_repo") == ["repo_name"]
+    assert registry.get_optional_parameters("gmail", "read") == {
+        "query": None,
+        "max_results": 10,
+        "date_filter": None,
+        "include_body": False,
+    }
+
+
+@pytest.mark.parametrize("agent_type, mode, parameters", [
+    ("gmail", "read", {}),
+    ("gmail", "send", {"to": "a@example.com", "subject": "s", "body": "b"}),
+    ("gmail", "search", {"query": "q"}),
+    ("github", "list_repos", {}),
+    ("github", "get_repo", {"repo_name": "vienna"}),
+])
+def test_shipped_modes_validate(agent_type, mode, parameters):
+    assert get_agent_registry().validate_mode_parameters(agent_type, mode, parameters) is None
+
+
+def test_unquoted_parameter_spec_is_rejected(tmp_path, monkeypatch):
+    config_dir = tmp_path / "src" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "agent_registry.yaml").write_text(
+        "agents:\n"
+        "  gmail:\n"
+        "    modes:\n"
+        "      read:\n"
+        "        parameters:\n"
+        "          - max_results (optional, default: 10)\n"
+    )
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+
+    with pytest.raises(ValueError, match=r"gmail\.read"):
+        get_agent_registry()
+    assert not (config_dir / "agent_registry.yaml.cache.json").exists()
+
+def test_changed_registry_is_reloaded_inline(tmp_path, monkeypatch):
+    config_dir = tmp_path / "src" / "config"
+    config_dir.mkdir(parents=True)
+    registry_file = config_dir / "agent_registry.yaml"
+    registry_file.write_text(
+        "agents:\n"
+        "  gmail:\n"
+        "    modes:\n"
+        "      read:\n"
+        "        parameters: []\n"
+    )
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+
+    registry = get_agent_registry()
+    assert registry.get_agent_modes("gmail") == ("read",)
+
+    registry_file.write_text(
+        "agents:\n"
+        "  gmail:\n"
+        "    modes:\n"
+        "      read:\n"
+        "        parameters: []\n"
+        "      send:\n"
+        "        parameters:\n"
+        "          - \"to (required)\"\n"
+    )
+    registry._next_reload_check = 0.0
+    threads = threading.active_count()
+
+    assert registry.get_required_parameters("gmail", "send") == ["to"]
+    assert registry.get_agent_modes("gmail") == ("read", "send")
+    assert threading.active_count() == threads
+
+
+def test_failed_reload_keeps_current_registry(tmp_path, monkeypatch):
+    config_dir = tmp_path / "src" / "config"
+    config_dir.mkdir(parents=True)
+    registry_file = config_dir / "agent_registry.yaml"
+    registry_file.write_text(
+        "agents:\n"
+        "  gmail:\n"
+        "    modes:\n"
+        "      send:\n"
+        "        parameters:\n"
+        "          - \"to (required)\"\n"
+    )
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+
+    registry = get_agent_registry()
+    registry_file.write_text(
+        "agents:\n"
+        "  gmail:\n"
+        "    modes:\n"
+        "      send:\n"
+        "        parameters:\n"
+        "          - to (optional, default: me)\n"
+    )
+    registry._next_reload_check = 0.0
+
+    assert registry.get_required_parameters("gmail", "send") == ["to"]
+
+
+def test_parsed_registry_is_cached(tmp_path, monkeypatch):
+    config_dir = tmp_path / "src" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "agent_registry.yaml").write_text(
+        "agents:\n"
+        "  gmail:\n"
+        "    modes:\n"
+        "      send:\n"
+        "        parameters:\n"
+        "          - \"to (required)\"\n"
+    )
+    monkeypatch.setenv("PROJECT_ROOT", str(tmp_path))
+    AgentRegistry()
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a fresh cache")
+
+    monkeypatch.setattr(agent_registry_module.yaml, "load", fail_parse)
+    assert AgentRegistry().get_required_parameters("gmail", "send") == ["to"]
\ No newline at end of file
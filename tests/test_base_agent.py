@@ -0,0 +1,23 @@
+"""Tests for BaseAgent error classification."""
+
+import httpx
+import pytest
+
+from src.agents.github_agent import GitHubAgent
+
+_REQUEST = httpx.Request("GET", "https://api.github.com/user")
+
+
+@pytest.mark.parametrize("error", [
+    httpx.ConnectError("connection refused", request=_REQUEST),
+    httpx.ReadTimeout("timed out", request=_REQUEST),
+    httpx.PoolTimeout("no connection available", request=_REQUEST),
+    httpx.RemoteProtocolError("server disconnected", request=_REQUEST),
+    ConnectionError("reset"),
+])
+def test_transport_errors_are_retryable(error):
+    assert GitHubAgent("user-1")._is_retryable_error(error)
+
+
+def test_invalid_parameters_are_not_retryable():
+    assert not GitHubAgent("user-1")._is_retryable_error(ValueError("Invalid sort_by value"))
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""Tests for the execution context."""
+
+from src.core import ExecutionContext
+
+
+def test_result_summaries_carry_size_without_data():
+    context = ExecutionContext("session-1", "user-1", "check my mail")
+    context.store_result("task_1", {
+        "status": "success",
+        "data": {"emails": [{"id": "m1"}], "count": 1},
+        "error": None,
+    })
+    context.store_result("task_2", {
+        "status": "error",
+        "data": None,
+        "error": {"code": "AUTH_FAILED", "message": "Token expired"},
+    })
+
+    assert list(context.iter_result_summaries()) == [
+        {"task_id": "task_1", "status": "success", "size": 2, "error": None},
+        {"task_id": "task_2", "status": "error", "size": 0, "error": "Token expired"},
+    ]
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""Tests for the GitHub ETag cache."""
+
+import sqlite3
+from types import SimpleNamespace
+
+import src.agents.etag_cache as etag_cache
+from src.agents.etag_cache import ETagCache
+from src.config import get_settings
+
+
+def test_memory_is_capped_by_bytes():
+    cache = ETagCache(None, max_memory_bytes=100)
+
+    cache.put("scope", "https://api.github.com/a", '"a"', b"x" * 60)
+    cache.put("scope", "https://api.github.com/b", '"b"', b"x" * 30)
+    cache.put("scope", "https://api.github.com/c", '"c"', b"x" * 30)
+    cache.put("scope", "https://api.github.com/huge", '"h"', b"x" * 101)
+
+    assert cache.get("scope", "https://api.github.com/a") is None
+    assert cache.get("scope", "https://api.github.com/b") == ('"b"', b"x" * 30)
+    assert cache.get("scope", "https://api.github.com/c") == ('"c"', b"x" * 30)
+    assert cache.get("scope", "https://api.github.com/huge") is None
+
+
+def test_large_bodies_are_served_from_disk(tmp_path):
+    cache = ETagCache(str(tmp_path / "cache.sqlite3"), max_memory_bytes=10)
+    cache.put("scope", "https://api.github.com/readme", '"r"', b"x" * 50)
+
+    assert cache.get("scope", "https://api.github.com/readme") == ('"r"', b"x" * 50)
+
+
+def test_touch_keeps_revalidated_entries_from_being_pruned(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite3")
+    clock = [1_000_000.0]
+    monkeypatch.setattr(etag_cache, "time", SimpleNamespace(time=lambda: clock[0]))
+
+    cache = ETagCache(path)
+    cache.put("scope", "https://api.github.com/used", '"u"', b"{}")
+    cache.put("scope", "https://api.github.com/stale", '"s"', b"{}")
+
+    clock[0] += etag_cache._MAX_DISK_AGE_SECONDS - 60
+    cache.touch("scope", "https://api.github.com/used")
+
+    clock[0] += 120
+    reopened = ETagCache(path)
+
+    assert reopened.get("scope", "https://api.github.com/used") == ('"u"', b"{}")
+    assert reopened.get("scope", "https://api.github.com/stale") is None
+
+
+def test_default_cache_file_is_in_user_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    path = get_settings().github_cache_file
+
+    assert path == str(tmp_path / "vienna" / "github_cache.sqlite3")
+    ETagCache(path).put("scope", "https://api.github.com/a", '"a"', b"{}")
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM etags").fetchone() == (1,)
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""Tests for the background Gmail token refresh."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import src.agents.gmail_agent as gmail_agent
+import src.auth.oauth_manager as oauth_manager
+from src.agents.gmail_agent import GmailAgent
+from src.auth import LazyAuthManager
+
+# TokenRefresher defaults: scan every 60 s for tokens expiring within 600 s
+REFRESH_INTERVAL = 60.0
+REFRESH_WINDOW = 600.0
+TOKEN_LIFETIME = 3600.0
+EPOCH = 1_700_000_000.0
+
+
+class FakeGmail:
+    """Fake clock, credential storage and Google token endpoint."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.background = False
+        self.refreshes = {"background": 0, "inline": 0}
+        self.issued = 0
+        self.credentials = {
+            "encrypted_token": "access-0",
+            "encrypted_refresh_token": "refresh",
+            "token_expiry": EPOCH + TOKEN_LIFETIME,
+        }
+
+    def time(self):
+        return EPOCH + self.now
+
+    def monotonic(self):
+        return self.now
+
+    def get_credentials(self, user_id, service):
+        return dict(self.credentials)
+
+    def store_credentials(self, user_id, service, encrypted_token, encrypted_refresh_token, token_expiry):
+        self.credentials = {
+            "encrypted_token": encrypted_token,
+            "encrypted_refresh_token": encrypted_refresh_token,
+            "token_expiry": token_expiry,
+        }
+
+    def refresh_gmail_token(self, refresh_token):
+        self.refreshes["background" if self.background else "inline"] += 1
+        self.issued += 1
+        return {
+            "access_token": f"access-{self.issued}",
+            "refresh_token": refresh_token,
+            "token_expiry": self.time() + TOKEN_LIFETIME,
+        }
+
+    def run_refresher(self):
+        self.background = True
+        try:
+            LazyAuthManager.refresh_expiring_tokens(REFRESH_WINDOW)
+        finally:
+            self.background = False
+
+
+@pytest.fixture
+def fake_gmail(monkeypatch):
+    fake = FakeGmail()
+    store = SimpleNamespace(
+        decrypt_token=lambda token: token,
+        encrypt_credentials=lambda access, refresh: (access, refresh),
+    )
+
+    monkeypatch.setattr(oauth_manager, "time", SimpleNamespace(time=fake.time, monotonic=fake.monotonic))
+    monkeypatch.setattr(oauth_manager, "_token_cache", {})
+    monkeypatch.setattr(oauth_manager, "get_credentials", fake.get_credentials)
+    monkeypatch.setattr(oauth_manager, "store_credentials", fake.store_credentials)
+    monkeypatch.setattr(oauth_manager, "get_credential_store", lambda: store)
+    monkeypatch.setattr(oauth_manager.GmailOAuthManager, "refresh_gmail_token", fake.refresh_gmail_token)
+    monkeypatch.setattr(gmail_agent, "_get_thread_service", lambda user_id, credentials: object())
+    return fake
+
+
+def test_active_user_is_refreshed_in_background(fake_gmail):
+    # The user runs a Gmail task every minute for two token lifetimes
+    for minute in range(125):
+        fake_gmail.now = minute * REFRESH_INTERVAL
+
+        agent = GmailAgent("user-1")
+        agent.authenticate()
+        assert agent.access_token == fake_gmail.credentials["encrypted_token"]
+        assert agent.refresh_token == "refresh"
+
+        fake_gmail.run_refresher()
+
+    assert fake_gmail.refreshes == {"background": 2, "inline": 0}
+
+
+def test_idle_user_is_not_refreshed(fake_gmail):
+    GmailAgent("user-1").authenticate()
+
+    for minute in range(125):
+        fake_gmail.now = minute * REFRESH_INTERVAL
+        fake_gmail.run_refresher()
+
+    assert fake_gmail.refreshes == {"background": 0, "inline": 0}
+    assert oauth_manager._token_cache == {}
\ No newline at end of file